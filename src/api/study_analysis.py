@@ -2,6 +2,7 @@
 API endpoints for study-specific analysis in NMDC CDM Browser.
 """
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 from typing import Dict, Optional
 from src.data_processing.study_analysis_processor import StudyAnalysisProcessor
 
@@ -9,15 +10,16 @@ router = APIRouter()
 processor = StudyAnalysisProcessor()
 
 @router.get("/study/{study_id}/analysis")
-async def get_study_analysis(study_id: str) -> Dict:
+async def get_study_analysis(study_id: str) -> ORJSONResponse:
     """Get complete analysis for a specific study."""
     try:
-        return processor.get_study_analysis(study_id)
+        # orjson serializes the numpy values in the analysis natively
+        return ORJSONResponse(processor.get_study_analysis(study_id))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/study/{study_id}/analysis/{component}")
-async def get_study_component(study_id: str, component: str) -> Dict:
+async def get_study_component(study_id: str, component: str) -> ORJSONResponse:
     """Get specific component of study analysis."""
     try:
         analysis = processor.get_study_analysis(study_id)
@@ -26,6 +28,6 @@ async def get_study_component(study_id: str, component: str) -> Dict:
                 status_code=404,
                 detail=f"Component {component} not found in study analysis"
             )
-        return analysis[component]
+        return ORJSONResponse(analysis[component])
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) 
\ No newline at end of file
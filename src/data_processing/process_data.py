@@ -1,5 +1,5 @@
 import logging
-from study_summary_processor import StudySummaryProcessor
+from study_summary_processor import StudySummaryProcessor, SIGNATURE_KEY
 from pathlib import Path
 import numpy as np
 
@@ -34,7 +34,14 @@ def main():
         # Initialize processor with correct paths
         processor = StudySummaryProcessor(data_dir=str(data_dir))
         
-        # Generate summary data
+        # Skip the recomputation when the saved summary was built from the current tables
+        output_file = processed_data_dir / "study_summary.json"
+        if processor.is_output_current(output_file):
+            logger.info(f"Source tables unchanged since {output_file} was written, skipping processing")
+            return
+        
+        # Generate summary data, reading both tables at once
+        processor.prewarm()
         summary_stats = processor.get_study_summary_stats()
         geographic_distribution = processor.get_geographic_distribution()
         study_cards = processor.generate_study_cards()
@@ -43,7 +50,8 @@ def main():
         summary_data = {
             "summary_stats": summary_stats,
             "geographic_distribution": geographic_distribution,
-            "study_cards": study_cards
+            "study_cards": study_cards,
+            SIGNATURE_KEY: processor.get_source_signature()
         }
         
         # Convert NumPy types to Python native types
@@ -58,7 +66,6 @@ def main():
         
         # Save to JSON file
         import json
-        output_file = processed_data_dir / "study_summary.json"
         logger.info(f"Writing output to: {output_file.absolute()}")
         with open(output_file, "w") as f:
             json.dump(summary_data, f, indent=2)
@@ -0,0 +1,50 @@
+"""
+Script to re-encode the raw parquet tables with zstd compression and larger row groups.
+"""
+import logging
+import os
+import sys
+from pathlib import Path
+
+import pyarrow.parquet as pq
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+COMPRESSION = 'zstd'
+COMPRESSION_LEVEL = 3
+ROW_GROUP_SIZE = 256_000
+DATA_PAGE_SIZE = 1 << 20
+
+def recompress_file(path: Path) -> None:
+    """Rewrite a parquet file in place with zstd compression."""
+    table = pq.read_table(path)
+    tmp_path = path.with_suffix('.parquet.tmp')
+    pq.write_table(
+        table,
+        tmp_path,
+        compression=COMPRESSION,
+        compression_level=COMPRESSION_LEVEL,
+        row_group_size=ROW_GROUP_SIZE,
+        use_dictionary=True,
+        data_page_size=DATA_PAGE_SIZE
+    )
+    # File names stay the same so every processor keeps finding its tables
+    os.replace(tmp_path, path)
+
+def main():
+    # Default to the project data directory
+    project_root = Path(__file__).parent.parent.parent
+    data_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else project_root / "data"
+    for path in sorted(data_dir.glob('*.parquet')):
+        size_before = path.stat().st_size
+        recompress_file(path)
+        size_after = path.stat().st_size
+        logger.info(f"Recompressed {path.name}: {size_before / 1e6:.1f} MB -> {size_after / 1e6:.1f} MB")
+
+if __name__ == "__main__":
+    main()
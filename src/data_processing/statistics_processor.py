@@ -1,7 +1,9 @@
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import dask.dataframe as dd
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 import json
 from datetime import datetime
 import logging
@@ -12,32 +14,95 @@ from functools import lru_cache
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Matches Timestamp.isoformat() for second-resolution dates
+ISO_DATE_FORMAT = '%Y-%m-%dT%H:%M:%S'
+
+# Sample table columns served by get_ecosystem_statistics
+ECOSYSTEM_VARIABLES = [
+    'ecosystem', 'ecosystem_category', 'ecosystem_subtype',
+    'ecosystem_type', 'env_broad_scale_label', 'env_local_scale_label',
+    'specific_ecosystem', 'env_medium_label', 'soil_horizon', 'soil_type'
+]
+
+def _equal_width_histogram(values: np.ndarray, bins: int, min_value: float, max_value: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Equal-width histogram matching np.histogram(values, bins=bins).
+    
+    Quantizes each value to its bin index in one arithmetic pass and counts
+    with np.bincount, instead of np.histogram's sort/search based path.
+    """
+    if not (np.isfinite(min_value) and np.isfinite(max_value)):
+        raise ValueError(f"autodetected range of [{min_value}, {max_value}] is not finite")
+    if min_value == max_value:
+        # Same fallback range as np.histogram for constant data
+        min_value, max_value = min_value - 0.5, max_value + 0.5
+    
+    bin_edges = np.linspace(min_value, max_value, bins + 1)
+    indices = ((values - min_value) * (bins / (max_value - min_value))).astype(np.intp)
+    indices[indices == bins] -= 1
+    # Fix up values that rounding placed one bin off their edges
+    indices[values < bin_edges[indices]] -= 1
+    indices[(values >= bin_edges[indices + 1]) & (indices != bins - 1)] += 1
+    return np.bincount(indices, minlength=bins), bin_edges
+
 class StatisticsProcessor:
     def __init__(self, data_dir: Optional[str] = None):
         # Get the project root directory (2 levels up from this file)
         project_root = Path(__file__).parent.parent.parent
         self.data_dir = Path(data_dir) if data_dir else project_root / "data"
         logger.info(f"Initialized StatisticsProcessor with data directory: {self.data_dir.absolute()}")
-        self._cache = {}
+        self._tables: Dict[str, pa.Table] = {}
+        self._cache: Dict[Union[str, Tuple[str, Tuple[str, ...]]], pd.DataFrame] = {}
+        self._ecosystem_value_counts: Optional[Dict[str, Dict]] = None
         
+    def _table(self, filename: str) -> pa.Table:
+        """Lazy load a parquet file as an Arrow table for building narrow pandas projections"""
+        if filename not in self._tables:
+            logger.debug(f"Loading {filename}...")
+            table = pq.read_table(self.data_dir / filename)
+            logger.debug(f"Loaded {table.num_rows} rows from {filename}")
+            self._tables[filename] = table
+        return self._tables[filename]
+    
+    def _to_pandas(self, table: pa.Table) -> pd.DataFrame:
+        """Convert an Arrow table to pandas, applying one-time column fixups"""
+        df = table.to_pandas()
+        # Parse collection dates once here rather than on every request
+        if 'collection_date' in df.columns:
+            df['collection_date'] = pd.to_datetime(df['collection_date'], errors='coerce')
+        return df
+    
     def _load_parquet(self, filename: str) -> pd.DataFrame:
         """Lazy load parquet data with caching"""
         if filename not in self._cache:
-            logger.debug(f"Loading {filename}...")
-            file_path = self.data_dir / filename
-            df = pd.read_parquet(file_path)
-            logger.debug(f"Loaded {len(df)} rows from {filename}")
-            self._cache[filename] = df
+            self._cache[filename] = self._to_pandas(self._table(filename))
+            # The full pandas frame supersedes the Arrow table; holding both doubles memory
+            self._tables.pop(filename, None)
         return self._cache[filename]
     
+    def _load_columns(self, filename: str, columns: List[str]) -> pd.DataFrame:
+        """Lazy load a cached pandas projection of the given columns.
+        
+        Columns missing from the file are skipped, so callers should still
+        check for them. Only the projected columns are materialized in pandas.
+        """
+        key = (filename, tuple(columns))
+        if key not in self._cache:
+            if filename in self._cache:
+                # Project from the full frame instead of reloading the released Arrow table
+                full = self._cache[filename]
+                return full[[col for col in columns if col in full.columns]]
+            table = self._table(filename)
+            available = [col for col in columns if col in table.column_names]
+            self._cache[key] = self._to_pandas(table.select(available))
+        return self._cache[key]
+    
     def get_timeline_data(self) -> Dict:
         """Get timeline data for samples and studies"""
         logger.info("Generating timeline data...")
         try:
-            samples_df = self._load_parquet("sample_table_snappy.parquet")
+            samples_df = self._load_columns("sample_table_snappy.parquet", ['id', 'study_id', 'collection_date'])
             
-            # Process sample timeline
-            samples_df['collection_date'] = pd.to_datetime(samples_df['collection_date'], errors='coerce')
+            # Process sample timeline (collection_date is parsed on load)
             valid_dates = samples_df[samples_df['collection_date'].notna()]
             no_dates = samples_df[samples_df['collection_date'].isna()]
             logger.info(f"Valid dates count: {len(valid_dates)}, No dates count: {len(no_dates)}")
@@ -47,44 +112,40 @@ class StatisticsProcessor:
             current_date = pd.Timestamp.now()
             
             if len(valid_dates) > 0:
-                earliest_date = valid_dates['collection_date'].min()
-                
-                for _, row in valid_dates.iterrows():
-                    try:
-                        sample_data = {
-                            'sample_id': str(row['id']),
-                            'date': row['collection_date'].isoformat(),
-                            'study_id': str(row['study_id'])
-                        }
-                        sample_timeline.append(sample_data)
-                    except Exception as e:
-                        logger.warning(f"Error processing sample {row.get('id', 'unknown')}: {str(e)}")
-                        continue
+                # Format all dates in one vectorized pass instead of per-row isoformat()
+                iso_dates = valid_dates['collection_date'].dt.strftime(ISO_DATE_FORMAT)
+                sample_timeline = [
+                    {
+                        'sample_id': str(sample_id),
+                        'date': date,
+                        'study_id': str(study_id)
+                    }
+                    for sample_id, date, study_id in zip(valid_dates['id'], iso_dates, valid_dates['study_id'])
+                ]
             
             # Process study timelines
             study_timelines = []
-            for study_id, study_group in samples_df.groupby('study_id'):
-                try:
-                    valid_dates = study_group['collection_date'].dropna()
-                    if len(valid_dates) > 0:
-                        study_data = {
-                            'study_id': str(study_id),
-                            'start_date': valid_dates.min().isoformat(),
-                            'end_date': valid_dates.max().isoformat(),
-                            'sample_count': len(valid_dates)
-                        }
-                        study_timelines.append(study_data)
-                    else:
-                        study_data = {
-                            'study_id': str(study_id),
-                            'start_date': current_date.isoformat(),
-                            'end_date': current_date.isoformat(),
-                            'sample_count': len(study_group)
-                        }
-                        study_timelines.append(study_data)
-                except Exception as e:
-                    logger.warning(f"Error processing study {study_id}: {str(e)}")
-                    continue
+            date_ranges = samples_df.groupby('study_id')['collection_date'].agg(['min', 'max', 'count', 'size'])
+            start_dates = date_ranges['min'].dt.strftime(ISO_DATE_FORMAT)
+            end_dates = date_ranges['max'].dt.strftime(ISO_DATE_FORMAT)
+            for study_id, start_date, end_date, count, size in zip(
+                date_ranges.index, start_dates, end_dates, date_ranges['count'], date_ranges['size']
+            ):
+                if count > 0:
+                    study_data = {
+                        'study_id': str(study_id),
+                        'start_date': start_date,
+                        'end_date': end_date,
+                        'sample_count': int(count)
+                    }
+                else:
+                    study_data = {
+                        'study_id': str(study_id),
+                        'start_date': current_date.isoformat(),
+                        'end_date': current_date.isoformat(),
+                        'sample_count': int(size)
+                    }
+                study_timelines.append(study_data)
             
             return {
                 'study_timelines': study_timelines,
@@ -116,38 +177,31 @@ class StatisticsProcessor:
                             return stats
         
         # If not found in cache, calculate from sample data
-        samples_df = self._load_parquet("sample_table_snappy.parquet")
-        
-        valid_variables = [
-            'ecosystem', 'ecosystem_category', 'ecosystem_subtype',
-            'ecosystem_type', 'env_broad_scale_label', 'env_local_scale_label',
-            'specific_ecosystem', 'env_medium_label', 'soil_horizon', 'soil_type'
-        ]
+        total_samples = self._table("sample_table_snappy.parquet").num_rows
         
-        if variable not in valid_variables:
+        if variable not in ECOSYSTEM_VARIABLES:
             logger.warning(f"Invalid ecosystem variable requested: {variable}")
             return {
                 'variable': variable,
                 'value_counts': {},
-                'total_samples': len(samples_df),
+                'total_samples': total_samples,
                 'unique_values': 0,
                 'error': f"Invalid ecosystem variable: {variable}"
             }
         
         # Check if column exists
-        if variable not in samples_df.columns:
+        ecosystem_counts = self._ecosystem_counts()
+        if variable not in ecosystem_counts:
             logger.warning(f"Column {variable} not found in sample table")
             return {
                 'variable': variable,
                 'value_counts': {},
-                'total_samples': len(samples_df),
+                'total_samples': total_samples,
                 'unique_values': 0,
                 'error': f"Column {variable} not found in sample table"
             }
         
-        # Handle null values by replacing them with "Unknown"
-        value_counts = samples_df[variable].fillna("Unknown").value_counts().to_dict()
-        total_samples = len(samples_df)
+        value_counts = ecosystem_counts[variable]
         
         return {
             'variable': variable,
@@ -156,10 +210,20 @@ class StatisticsProcessor:
             'unique_values': len(value_counts)
         }
     
+    def _ecosystem_counts(self) -> Dict[str, Dict]:
+        """Value counts for every ecosystem variable, computed once per instance"""
+        if self._ecosystem_value_counts is None:
+            samples_df = self._load_columns("sample_table_snappy.parquet", ECOSYSTEM_VARIABLES)
+            # Handle null values by replacing them with "Unknown"
+            self._ecosystem_value_counts = {
+                variable: samples_df[variable].fillna("Unknown").value_counts().to_dict()
+                for variable in samples_df.columns
+            }
+        return self._ecosystem_value_counts
+    
     def get_physical_variable_statistics(self, variable: str) -> Dict:
         """Get statistics for a specific physical variable"""
         logger.info(f"Generating physical variable statistics for {variable}...")
-        samples_df = self._load_parquet("sample_table_snappy.parquet")
         
         valid_variables = [
             'ammonium_nitrogen_numeric',
@@ -210,9 +274,13 @@ class StatisticsProcessor:
                 'error': f"Invalid physical variable: {variable}"
             }
         
+        # Load only after validation so arbitrary names never become cache entries
+        samples_df = self._load_columns("sample_table_snappy.parquet", [variable])
+        
         # Check if column exists
         if variable not in samples_df.columns:
-            logger.warning(f"Column {variable} not found in sample table. Available columns: {samples_df.columns.tolist()}")
+            available_columns = self._table("sample_table_snappy.parquet").column_names
+            logger.warning(f"Column {variable} not found in sample table. Available columns: {available_columns}")
             return {
                 'variable': variable,
                 'error': f"Column {variable} not found in sample table"
@@ -228,17 +296,18 @@ class StatisticsProcessor:
             }
         
         # Log the value range for debugging
-        logger.info(f"Value range for {variable}: min={values.min()}, max={values.max()}")
+        min_value, max_value = float(values.min()), float(values.max())
+        logger.info(f"Value range for {variable}: min={min_value}, max={max_value}")
         
         # Calculate histogram
-        hist, bin_edges = np.histogram(values, bins=50)
+        hist, bin_edges = _equal_width_histogram(values.to_numpy(dtype=np.float64), 50, min_value, max_value)
         
         return {
             'variable': variable,
             'mean': float(values.mean()),
             'std': float(values.std()),
-            'min': float(values.min()),
-            'max': float(values.max()),
+            'min': min_value,
+            'max': max_value,
             'count': int(len(values)),
             'histogram': {
                 'values': hist.tolist(),
@@ -291,59 +360,64 @@ class StatisticsProcessor:
             'Inchi', 'Inchi Key', 'Peak Area'
         ]
         
-        # Add missing columns with NaN values
+        # Work on a local projection so the cached frame is never mutated;
+        # missing columns come back as NaN
         for col in required_columns:
             if col not in df.columns:
                 logger.warning(f"Missing required column: {col}")
-                df[col] = np.nan
+        df = df.reindex(columns=required_columns)
         
         # Ensure Peak Area is numeric
         df['Peak Area'] = pd.to_numeric(df['Peak Area'], errors='coerce')
         
         # Group by compound and calculate statistics
-        compound_stats = df.groupby('Compound Name', dropna=False).agg({
-            'Peak Area': ['mean', 'std'],
-            'Common Name': 'first',
-            'IUPAC Name': 'first',
-            'Traditional Name': 'first',
-            'Molecular Formula': 'first',
-            'Smiles': 'first',
-            'Chebi ID': 'first',
-            'Kegg Compound ID': 'first',
-            'Inchi': 'first',
-            'Inchi Key': 'first'
-        })
-        
-        # Flatten the MultiIndex columns
-        compound_stats.columns = ['_'.join(col).strip() for col in compound_stats.columns.values]
-        compound_stats = compound_stats.reset_index()
+        compound_stats = df.groupby('Compound Name', dropna=False).agg(
+            peak_area_mean=('Peak Area', 'mean'),
+            peak_area_std=('Peak Area', 'std'),
+            common_name=('Common Name', 'first'),
+            iupac_name=('IUPAC Name', 'first'),
+            traditional_name=('Traditional Name', 'first'),
+            molecular_formula=('Molecular Formula', 'first'),
+            smiles=('Smiles', 'first'),
+            chebi_id=('Chebi ID', 'first'),
+            kegg_id=('Kegg Compound ID', 'first'),
+            inchi=('Inchi', 'first'),
+            inchi_key=('Inchi Key', 'first')
+        )
         
         # Sort by mean peak area and get top 10
-        top_compounds = compound_stats.sort_values('Peak Area_mean', ascending=False).head(10)
+        top_compounds = compound_stats.sort_values('peak_area_mean', ascending=False).head(10)
         logger.info(f"Top compounds:\n{top_compounds}")
         
+        # Blank out missing names once for the whole slice instead of per field
+        string_columns = [
+            'common_name', 'iupac_name', 'traditional_name', 'molecular_formula',
+            'smiles', 'chebi_id', 'kegg_id', 'inchi', 'inchi_key'
+        ]
+        top_compounds = top_compounds.fillna({col: '' for col in string_columns})
+        
         # Format results
         results = []
-        for _, row in top_compounds.iterrows():
+        for row in top_compounds.itertuples():
             try:
                 result_dict = {
-                    'compound_name': str(row['Compound Name']) if pd.notna(row['Compound Name']) else 'Unnamed',
-                    'common_name': str(row['Common Name_first']) if pd.notna(row['Common Name_first']) else '',
-                    'iupac_name': str(row['IUPAC Name_first']) if pd.notna(row['IUPAC Name_first']) else '',
-                    'traditional_name': str(row['Traditional Name_first']) if pd.notna(row['Traditional Name_first']) else '',
-                    'molecular_formula': str(row['Molecular Formula_first']) if pd.notna(row['Molecular Formula_first']) else '',
-                    'smiles': str(row['Smiles_first']) if pd.notna(row['Smiles_first']) else '',
-                    'chebi_id': str(row['Chebi ID_first']) if pd.notna(row['Chebi ID_first']) else '',
-                    'kegg_id': str(row['Kegg Compound ID_first']) if pd.notna(row['Kegg Compound ID_first']) else '',
-                    'inchi': str(row['Inchi_first']) if pd.notna(row['Inchi_first']) else '',
-                    'inchi_key': str(row['Inchi Key_first']) if pd.notna(row['Inchi Key_first']) else '',
-                    'mean_abundance': float(row['Peak Area_mean']),
-                    'std_abundance': float(row['Peak Area_std'])
+                    'compound_name': str(row.Index) if pd.notna(row.Index) else 'Unnamed',
+                    'common_name': str(row.common_name),
+                    'iupac_name': str(row.iupac_name),
+                    'traditional_name': str(row.traditional_name),
+                    'molecular_formula': str(row.molecular_formula),
+                    'smiles': str(row.smiles),
+                    'chebi_id': str(row.chebi_id),
+                    'kegg_id': str(row.kegg_id),
+                    'inchi': str(row.inchi),
+                    'inchi_key': str(row.inchi_key),
+                    'mean_abundance': float(row.peak_area_mean),
+                    'std_abundance': float(row.peak_area_std)
                 }
                 results.append(result_dict)
             except Exception as e:
-                logger.warning(f"Error processing compound {row['Compound Name']}: {str(e)}")
-                logger.warning(f"Row data: {row.to_dict()}")
+                logger.warning(f"Error processing compound {row.Index}: {str(e)}")
+                logger.warning(f"Row data: {row._asdict()}")
                 continue
         
         return results
@@ -358,9 +432,9 @@ class StatisticsProcessor:
             'Lipid Category', 'Area'
         ]
         
-        for col in required_columns:
-            if col not in df.columns:
-                df[col] = np.nan
+        # Work on a local projection so the cached frame is never mutated;
+        # missing columns come back as NaN
+        df = df.reindex(columns=required_columns)
         
         # Ensure Area is numeric
         df['Area'] = pd.to_numeric(df['Area'], errors='coerce')
@@ -377,28 +451,36 @@ class StatisticsProcessor:
         )
         
         # Calculate statistics
-        stats = df.groupby('lipid_key', dropna=False).agg({
-            'Area': ['mean', 'std']
-        })
-        
-        # Flatten the MultiIndex columns
-        stats.columns = ['_'.join(col).strip() for col in stats.columns.values]
-        stats = stats.reset_index()
+        stats = df.groupby('lipid_key', dropna=False).agg(
+            area_mean=('Area', 'mean'),
+            area_std=('Area', 'std')
+        )
         
         # Sort by mean area and get top 10
-        top_10 = stats.sort_values('Area_mean', ascending=False).head(10)
+        top_10 = stats.sort_values('area_mean', ascending=False).head(10)
+        
+        # Get additional lipid information from the first row of each top lipid
+        lipid_info = (
+            df.drop_duplicates('lipid_key')
+            .set_index('lipid_key')
+            .loc[top_10.index, ['Lipid Molecular Species', 'Lipid Class', 'Lipid Category']]
+            .fillna({'Lipid Molecular Species': 'Unnamed', 'Lipid Class': '', 'Lipid Category': ''})
+        )
         
-        # Get additional lipid information
         result = []
-        for _, row in top_10.iterrows():
+        for row, species, lipid_class, category in zip(
+            top_10.itertuples(),
+            lipid_info['Lipid Molecular Species'],
+            lipid_info['Lipid Class'],
+            lipid_info['Lipid Category']
+        ):
             try:
-                lipid_info = df[df['lipid_key'] == row['lipid_key']].iloc[0]
                 result.append({
-                    'lipid_molecular_species': str(lipid_info.get('Lipid Molecular Species', '')) if pd.notna(lipid_info.get('Lipid Molecular Species')) else 'Unnamed',
-                    'lipid_class': str(lipid_info.get('Lipid Class', '')) if pd.notna(lipid_info.get('Lipid Class')) else '',
-                    'lipid_category': str(lipid_info.get('Lipid Category', '')) if pd.notna(lipid_info.get('Lipid Category')) else '',
-                    'mean_abundance': float(row['Area_mean']),
-                    'std_abundance': float(row['Area_std'])
+                    'lipid_molecular_species': str(species),
+                    'lipid_class': str(lipid_class),
+                    'lipid_category': str(category),
+                    'mean_abundance': float(row.area_mean),
+                    'std_abundance': float(row.area_std)
                 })
             except Exception as e:
                 continue
@@ -417,10 +499,12 @@ class StatisticsProcessor:
             'GeneCount', 'SummedPeptideMASICAbundances', 'UniquePeptideCount'
         ]
         
+        # Work on a local projection so the cached frame is never mutated;
+        # missing columns come back as NaN
         for col in required_columns:
             if col not in df.columns:
                 logger.warning(f"Missing required column: {col}")
-                df[col] = np.nan
+        df = df.reindex(columns=required_columns)
         
         # Ensure numeric columns are properly typed
         df['GeneCount'] = pd.to_numeric(df['GeneCount'], errors='coerce')
@@ -428,41 +512,44 @@ class StatisticsProcessor:
         df['UniquePeptideCount'] = pd.to_numeric(df['UniquePeptideCount'], errors='coerce')
         
         # Group by protein identifiers and calculate statistics
-        stats = df.groupby('Product', dropna=False).agg({
-            'SummedPeptideMASICAbundances': ['mean', 'std'],
-            'GeneCount': 'first',
-            'UniquePeptideCount': 'first',
-            'EC_Number': 'first',
-            'pfam': 'first',
-            'KO': 'first',
-            'COG': 'first'
-        })
-        
-        # Flatten the MultiIndex columns
-        stats.columns = ['_'.join(col).strip() for col in stats.columns.values]
-        stats = stats.reset_index()
+        stats = df.groupby('Product', dropna=False).agg(
+            abundance_mean=('SummedPeptideMASICAbundances', 'mean'),
+            abundance_std=('SummedPeptideMASICAbundances', 'std'),
+            gene_count=('GeneCount', 'first'),
+            unique_peptide_count=('UniquePeptideCount', 'first'),
+            ec_number=('EC_Number', 'first'),
+            pfam=('pfam', 'first'),
+            ko=('KO', 'first'),
+            cog=('COG', 'first')
+        )
         
         # Sort by mean abundance and get top 10
-        top_10 = stats.sort_values('SummedPeptideMASICAbundances_mean', ascending=False).head(10)
+        top_10 = stats.sort_values('abundance_mean', ascending=False).head(10)
+        
+        # Fill missing annotations once for the whole slice instead of per field
+        top_10 = top_10.fillna({
+            'ec_number': '', 'pfam': '', 'ko': '', 'cog': '',
+            'gene_count': 0, 'unique_peptide_count': 0
+        })
         
         # Get additional protein information
         result = []
-        for _, row in top_10.iterrows():
+        for row in top_10.itertuples():
             try:
                 result.append({
-                    'product': str(row['Product']) if pd.notna(row['Product']) else 'Unnamed',
-                    'ec_number': str(row['EC_Number_first']) if pd.notna(row['EC_Number_first']) else '',
-                    'pfam': str(row['pfam_first']) if pd.notna(row['pfam_first']) else '',
-                    'ko': str(row['KO_first']) if pd.notna(row['KO_first']) else '',
-                    'cog': str(row['COG_first']) if pd.notna(row['COG_first']) else '',
-                    'gene_count': int(row['GeneCount_first']) if pd.notna(row['GeneCount_first']) else 0,
-                    'unique_peptide_count': int(row['UniquePeptideCount_first']) if pd.notna(row['UniquePeptideCount_first']) else 0,
-                    'mean_abundance': float(row['SummedPeptideMASICAbundances_mean']),
-                    'std_abundance': float(row['SummedPeptideMASICAbundances_std'])
+                    'product': str(row.Index) if pd.notna(row.Index) else 'Unnamed',
+                    'ec_number': str(row.ec_number),
+                    'pfam': str(row.pfam),
+                    'ko': str(row.ko),
+                    'cog': str(row.cog),
+                    'gene_count': int(row.gene_count),
+                    'unique_peptide_count': int(row.unique_peptide_count),
+                    'mean_abundance': float(row.abundance_mean),
+                    'std_abundance': float(row.abundance_std)
                 })
             except Exception as e:
-                logger.warning(f"Error processing protein {row['Product']}: {str(e)}")
-                logger.warning(f"Row data: {row.to_dict()}")
+                logger.warning(f"Error processing protein {row.Index}: {str(e)}")
+                logger.warning(f"Row data: {row._asdict()}")
                 continue
         
         logger.info(f"Final result count: {len(result)}")
@@ -510,40 +597,31 @@ class StatisticsProcessor:
                         continue
                     
                     # Calculate statistics
-                    stats = rank_df.groupby('label').agg({
-                        'read_count': ['mean', 'std'],
-                        'abundance': ['mean', 'std']
-                    })
-                    
-                    # Flatten the MultiIndex columns
-                    stats.columns = ['_'.join(col).strip() for col in stats.columns.values]
-                    stats = stats.reset_index()
+                    stats = rank_df.groupby('label').agg(
+                        read_count_mean=('read_count', 'mean'),
+                        read_count_std=('read_count', 'std'),
+                        abundance_mean=('abundance', 'mean'),
+                        abundance_std=('abundance', 'std')
+                    )
                     
-                    # Sort by mean abundance and get top 10
-                    top_10 = stats.sort_values('abundance_mean', ascending=False).head(10)
+                    # Sort by mean abundance and get top 10, replacing NaN values with 0
+                    top_10 = stats.sort_values('abundance_mean', ascending=False).head(10).fillna(0)
                     
                     # Format results
                     rank_results = []
-                    for _, row in top_10.iterrows():
+                    for row in top_10.itertuples():
                         try:
-                            result_dict = {
+                            rank_results.append({
                                 'rank': rank,
-                                'label': str(row['label']),
-                                'mean_read_count': float(row['read_count_mean']),
-                                'std_read_count': float(row['read_count_std']),
-                                'mean_abundance': float(row['abundance_mean']),
-                                'std_abundance': float(row['abundance_std'])
-                            }
-                            
-                            # Replace NaN values with 0 for numeric fields
-                            for key, value in result_dict.items():
-                                if pd.isna(value):
-                                    result_dict[key] = 0
-                            
-                            rank_results.append(result_dict)
+                                'label': str(row.Index),
+                                'mean_read_count': float(row.read_count_mean),
+                                'std_read_count': float(row.read_count_std),
+                                'mean_abundance': float(row.abundance_mean),
+                                'std_abundance': float(row.abundance_std)
+                            })
                         except Exception as e:
-                            logger.warning(f"Error processing gottcha entry {row['label']}: {str(e)}")
-                            logger.warning(f"Row data: {row.to_dict()}")
+                            logger.warning(f"Error processing gottcha entry {row.Index}: {str(e)}")
+                            logger.warning(f"Row data: {row._asdict()}")
                             continue
                     
                     result[rank] = rank_results
@@ -580,50 +658,44 @@ class StatisticsProcessor:
                 if col in rank_df.columns:
                     rank_df[col] = pd.to_numeric(rank_df[col], errors='coerce')
             
-            # Group by lineage and calculate statistics
-            # Calculate mean and std for each column separately
-            mean_stats = rank_df.groupby('lineage').agg({
-                'abundance': 'mean',
-                **({'species_count': 'mean'} if 'species_count' in columns and analysis_type in ['contigs', 'centrifuge'] else {}),
-                **({'read_count': 'mean'} if 'read_count' in columns else {})
-            })
+            # Group by lineage once and calculate mean and std together
+            stat_columns = ['abundance']
+            if 'species_count' in columns and analysis_type in ['contigs', 'centrifuge']:
+                stat_columns.append('species_count')
+            if 'read_count' in columns:
+                stat_columns.append('read_count')
             
-            std_stats = rank_df.groupby('lineage').agg({
-                'abundance': 'std',
-                **({'species_count': 'std'} if 'species_count' in columns and analysis_type in ['contigs', 'centrifuge'] else {}),
-                **({'read_count': 'std'} if 'read_count' in columns else {})
-            })
+            aggregations = {}
+            for col in stat_columns:
+                aggregations[f'{col}_mean'] = (col, 'mean')
+                aggregations[f'{col}_std'] = (col, 'std')
+            stats = rank_df.groupby('lineage').agg(**aggregations)
             
-            # Combine the statistics
-            stats = pd.concat([
-                mean_stats.add_suffix('_mean'),
-                std_stats.add_suffix('_std')
-            ], axis=1).reset_index()
-            
-            # Sort by mean abundance and get top 10
-            top_10 = stats.sort_values('abundance_mean', ascending=False).head(10)
+            # Sort by mean abundance and get top 10, replacing NaN values with 0
+            top_10 = stats.sort_values('abundance_mean', ascending=False).head(10).fillna(0)
             
             # Format results
             rank_results = []
-            for _, row in top_10.iterrows():
-                taxon_info = rank_df[rank_df['lineage'] == row['lineage']].iloc[0]
+            for row in top_10.itertuples():
+                lineage = row.Index
+                taxon_info = rank_df[rank_df['lineage'] == lineage].iloc[0]
                 result_dict = {
                     'rank': rank,
-                    'lineage': str(row['lineage']),
-                    'mean_abundance': float(row['abundance_mean']),
-                    'std_abundance': float(row['abundance_std'])
+                    'lineage': str(lineage),
+                    'mean_abundance': float(row.abundance_mean),
+                    'std_abundance': float(row.abundance_std)
                 }
                 
-                if 'species_count' in columns and analysis_type in ['contigs', 'centrifuge']:
+                if 'species_count' in stat_columns:
                     result_dict.update({
-                        'mean_species_count': float(row.get('species_count_mean', 0)),
-                        'std_species_count': float(row.get('species_count_std', 0))
+                        'mean_species_count': float(row.species_count_mean),
+                        'std_species_count': float(row.species_count_std)
                     })
                 
-                if 'read_count' in columns:
+                if 'read_count' in stat_columns:
                     result_dict.update({
-                        'mean_read_count': float(row.get('read_count_mean', 0)),
-                        'std_read_count': float(row.get('read_count_std', 0))
+                        'mean_read_count': float(row.read_count_mean),
+                        'std_read_count': float(row.read_count_std)
                     })
                 
                 if 'label' in columns:
@@ -632,11 +704,6 @@ class StatisticsProcessor:
                 if 'name' in columns:
                     result_dict['name'] = str(taxon_info.get('name', ''))
                 
-                # Replace NaN values with empty strings for string fields
-                for key, value in result_dict.items():
-                    if pd.isna(value):
-                        result_dict[key] = '' if isinstance(value, str) else 0
-                
                 rank_results.append(result_dict)
             
             result[rank] = rank_results
@@ -6,20 +6,185 @@ with comparisons to the overall compendium.
 import logging
 from typing import Dict, List, Optional, Tuple, Union, Any
 import numpy as np
-from scipy.stats import mannwhitneyu
+from scipy.stats import mannwhitneyu, norm
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.feather as feather
 import os
+import hashlib
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from src.data_processing.statistics_processor import StatisticsProcessor
 from tqdm import tqdm
 import time
 import json
+import orjson
 from .study_summary_processor import convert_numpy_types
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Seconds during which a source file scan is reused by _check_data_changes
+MODIFICATION_CHECK_TTL = 5.0
+
+# Source table, identifier, value and annotation columns for each omics type
+OMICS_CONFIG = {
+    'metabolomics': {
+        'filename': 'metabolite_table_snappy.parquet',
+        'id_col': 'Compound Name',
+        'value_col': 'Peak Area',
+        'additional_fields': {
+            'Common Name': 'common_name',
+            'IUPAC Name': 'iupac_name',
+            'Traditional Name': 'traditional_name',
+            'Molecular Formula': 'molecular_formula',
+            'ChEBI ID': 'chebi_id',
+            'KEGG Compound ID': 'kegg_compound_id'
+        }
+    },
+    'lipidomics': {
+        'filename': 'lipidomics_table_snappy.parquet',
+        'id_col': 'Lipid Molecular Species',
+        'value_col': 'Area',
+        'additional_fields': {
+            'Lipid Class': 'lipid_class',
+            'Lipid Category': 'lipid_category'
+        }
+    },
+    'proteomics': {
+        'filename': 'proteomics_table_snappy.parquet',
+        'id_col': 'Product',
+        'value_col': 'SummedPeptideMASICAbundances',
+        'additional_fields': {
+            'EC_Number': 'ec_number',
+            'pfam': 'pfam',
+            'KO': 'ko',
+            'COG': 'cog',
+            'GeneCount': 'gene_count',
+            'UniquePeptideCount': 'unique_peptide_count'
+        }
+    }
+}
+
+# Source table, taxon identifier, abundance and rank columns for each taxonomic type
+TAXONOMIC_CONFIG = {
+    'gottcha': {
+        'filename': 'gottcha_table_snappy.parquet',
+        'id_col': 'label',
+        'value_col': 'abundance',
+        'rank_col': 'rank',
+        'species_counts': False
+    },
+    'kraken': {
+        'filename': 'kraken_table_snappy.parquet',
+        'id_col': 'name',
+        'value_col': 'abundance',
+        'rank_col': 'rank',
+        'species_counts': False
+    },
+    'centrifuge': {
+        'filename': 'centrifuge_rollup_table_snappy.parquet',
+        'id_col': 'lineage',
+        'value_col': 'abundance',
+        'rank_col': 'rank',
+        'species_counts': True
+    },
+    'contigs': {
+        'filename': 'contigs_rollup_table_snappy.parquet',
+        'id_col': 'lineage',
+        'value_col': 'abundance',
+        'rank_col': 'rank',
+        'species_counts': True
+    }
+}
+
+# Taxonomic ranks reported by the analysis, from broadest to narrowest
+TAXONOMIC_RANKS = ['superkingdom', 'phylum', 'class', 'order', 'family', 'genus', 'species']
+
+# Sample table columns compared against the compendium
+PHYSICAL_VARIABLES = [
+    # Nitrogen-related variables
+    'ammonium_has_numeric_value',
+    'ammonium_nitrogen_has_numeric_value',
+    'ammonium_nitrogen_numeric',
+    'nitrate_nitrogen_numeric',
+    'nitrite_nitrogen_numeric',
+    'nitro_has_numeric_value',
+    'tot_nitro_content_has_numeric_value',
+    'tot_nitro_numeric',
+    'diss_inorg_nitro_has_numeric_value',
+
+    # Carbon-related variables
+    'tot_carb',
+    'diss_inorg_carb_has_numeric_value',
+    'diss_org_carb_has_numeric_value',
+    'org_carb_has_numeric_value',
+    'carb_nitro_ratio',
+    'carb_nitro_ratio_has_numeric_value',
+
+    # Mineral and metal variables
+    'calcium_has_numeric_value',
+    'calcium_numeric',
+    'magnesium_has_numeric_value',
+    'magnesium_numeric',
+    'manganese_has_numeric_value',
+    'manganese_numeric',
+    'zinc_numeric',
+    'diss_iron_has_numeric_value',
+    'potassium_has_numeric_value',
+    'potassium_numeric',
+    'sodium_has_numeric_value',
+    'chloride_has_numeric_value',
+    'sulfate_has_numeric_value',
+
+    # Phosphorus-related variables
+    'tot_phosp_has_numeric_value',
+    'tot_phosp_numeric',
+    'soluble_react_phosp_has_numeric_value',
+
+    # Physical parameters
+    'ph',
+    'temp_has_numeric_value',
+    'conduc_has_numeric_value',
+    'diss_oxygen_has_numeric_value',
+    'chlorophyll_has_numeric_value',
+    'water_content_numeric',
+
+    # Depth and size measurements
+    'depth',
+    'depth_has_numeric_value',
+    'depth_has_maximum_numeric_value',
+    'depth_has_minimum_numeric_value',
+    'samp_size_numeric',
+    'samp_size_has_numeric_value',
+
+    # Environmental measurements
+    'abs_air_humidity',
+    'avg_temp',
+    'humidity',
+    'latitude',
+    'longitude',
+    'photon_flux',
+    'solar_irradiance',
+    'wind_speed',
+
+    # Other measurements
+    'host_age_numeric',
+    'lbc_thirty_numeric',
+    'lbceq_numeric'
+]
+
+# Sample columns reported with each map location
+MAP_SAMPLE_COLUMNS = [
+    'id', 'sample_name', 'collection_date', 'collection_time', 'latitude', 'longitude',
+    'ecosystem', 'ecosystem_type', 'ecosystem_subtype', 'specific_ecosystem',
+    'depth', 'temp_has_numeric_value', 'ph', 'salinity'
+]
+
 class StudyAnalysisProcessor(StatisticsProcessor):
     """Processor for study-specific statistics with compendium comparisons."""
     
@@ -39,8 +204,16 @@ class StudyAnalysisProcessor(StatisticsProcessor):
             logger.info(f"Cache directory contents: {list(self.cache_dir.glob('*.json'))}")
         self._study_df = None
         self._sample_df = None
+        self._study_sample_positions: Optional[Dict[str, np.ndarray]] = None
+        self._omics_cache: Dict[str, pd.DataFrame] = {}
+        self._taxonomic_cache: Dict[str, pd.DataFrame] = {}
+        self._study_means: Optional[pd.DataFrame] = None
+        self._data_coverage: Optional[Dict] = None
+        self._cache_hits = 0  # In-memory data coverage lookups served without recomputation
         self.cache = {}
         self.last_file_modification = self._get_latest_file_modification()
+        self._data_dir_modification = self._get_data_dir_modification()
+        self._modification_checked_at = time.time()
         self.show_progress = True  # Flag to control progress bar display
         
         # Validate cache at startup
@@ -49,7 +222,7 @@ class StudyAnalysisProcessor(StatisticsProcessor):
     def _validate_cache_at_startup(self) -> None:
         """Validate all cache files at startup and report their status."""
         logger.info("Validating cache files at startup...")
-        cache_files = list(self.cache_dir.glob('*.json'))
+        cache_files = list(self.cache_dir.glob('*.json')) + list(self.cache_dir.glob('*/*.json'))
         logger.info(f"Found {len(cache_files)} cache files")
         
         # Skip AI summary files
@@ -91,22 +264,119 @@ class StudyAnalysisProcessor(StatisticsProcessor):
         logger.info(f"  - Error reading caches: {error_count}")
         logger.info(f"  - Total cache files: {len(cache_files)}")
         
+    def _get_cache_shard(self, study_id: str) -> Path:
+        """Get the cache subdirectory for a study, named after the first two hex digits of its md5."""
+        return self.cache_dir / hashlib.md5(study_id.encode()).hexdigest()[:2]
+        
     def _get_cache_path(self, study_id: str) -> Path:
         """Get the cache file path for a study."""
-        return self.cache_dir / f"{study_id}.json"
+        return self._get_cache_shard(study_id) / f"{study_id}.json"
+        
+    def _get_table_dir(self, study_id: str) -> Path:
+        """Get the directory holding the Feather tables of a cached study."""
+        return self._get_cache_shard(study_id) / study_id
+        
+    def _get_taxonomic_top10_cache_path(self, study_id: str, tax_type: str) -> Path:
+        """Get the cache file path of the taxonomic top 10 of one type for a study."""
+        return self._get_table_dir(study_id) / f"taxonomic_top10_{tax_type}.json"
+        
+    def _load_taxonomic_top10_cache(self, study_id: str, tax_type: str) -> Optional[Dict]:
+        """Load the cached taxonomic top 10 of one type if it is newer than its source tables."""
+        cache_path = self._get_taxonomic_top10_cache_path(study_id, tax_type)
+        try:
+            # Only the taxonomic table and the sample table feed this result, so it
+            # stays valid when other source tables change
+            source_modification = max(
+                os.path.getmtime(self.data_dir / TAXONOMIC_CONFIG[tax_type]['filename']),
+                os.path.getmtime(self.data_dir / "sample_table_snappy.parquet")
+            )
+            if cache_path.exists() and os.path.getmtime(cache_path) > source_modification:
+                with open(cache_path, 'rb') as f:
+                    return orjson.loads(f.read())
+        except Exception as e:
+            logger.warning(f"Error loading {tax_type} top 10 cache for study {study_id}: {str(e)}")
+        return None
+        
+    def _save_taxonomic_top10_cache(self, study_id: str, tax_type: str, results: Dict) -> None:
+        """Save the taxonomic top 10 of one type for a study."""
+        cache_path = self._get_taxonomic_top10_cache_path(study_id, tax_type)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, 'wb') as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_SERIALIZE_NUMPY))
+        except Exception as e:
+            logger.warning(f"Error saving {tax_type} top 10 cache for study {study_id}: {str(e)}")
+        
+    def _migrate_flat_cache(self, study_id: str) -> None:
+        """Move a cache entry from the old flat layout into its shard."""
+        flat_path = self.cache_dir / f"{study_id}.json"
+        if not flat_path.exists():
+            return
+        try:
+            shard = self._get_cache_shard(study_id)
+            shard.mkdir(exist_ok=True)
+            flat_table_dir = self.cache_dir / study_id
+            if flat_table_dir.is_dir():
+                os.replace(flat_table_dir, self._get_table_dir(study_id))
+            # Renaming keeps the modification time the cache validity check relies on
+            os.replace(flat_path, self._get_cache_path(study_id))
+            logger.info(f"Moved cache for study {study_id} to {shard.name}/")
+        except OSError as e:
+            logger.warning(f"Error moving cache for study {study_id}: {str(e)}")
+        
+    def _get_table_slots(self, analysis: Dict) -> List[Tuple[str, Dict, str]]:
+        """Find the row lists of an analysis that are cached as Feather tables."""
+        slots = []
+        for omics_type in analysis.get('omics', {}).get('outliers', {}):
+            slots.append((f"omics_{omics_type}", analysis['omics']['outliers'], omics_type))
+        for tax_type, ranks in analysis.get('taxonomic', {}).get('outliers', {}).items():
+            if isinstance(ranks, dict):
+                for rank in ranks:
+                    slots.append((f"taxonomic_{tax_type}_{rank}", ranks, rank))
+        if 'locations' in analysis.get('map_data', {}):
+            slots.append(('map_locations', analysis['map_data'], 'locations'))
+        return slots
+        
+    def _rows_to_table(self, rows: Any) -> Optional[pa.Table]:
+        """Convert a list of uniform records to an Arrow table, or None if it would not round-trip."""
+        if not isinstance(rows, list) or not rows or not all(isinstance(row, dict) for row in rows):
+            return None
+        keys = list(rows[0])
+        if any(list(row) != keys for row in rows):
+            return None
+        try:
+            table = pa.Table.from_pylist(rows)
+            # Keep the table only if it decodes back to the same records; Arrow may
+            # reorder the fields of nested records, so key order is not compared
+            options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_SORT_KEYS
+            if orjson.dumps(table.to_pylist(), default=str, option=options) != orjson.dumps(rows, default=str, option=options):
+                return None
+            return table
+        except (pa.ArrowException, TypeError, ValueError):
+            return None
         
     def _load_from_cache(self, study_id: str) -> Optional[Dict]:
         """Load analysis results from cache file."""
         cache_path = self._get_cache_path(study_id)
+        if not cache_path.exists():
+            self._migrate_flat_cache(study_id)
         if cache_path.exists():
             try:
                 # Check if cache file is newer than source files
                 cache_mod_time = os.path.getmtime(cache_path)
                 if cache_mod_time > self.last_file_modification:
-                    with open(cache_path, 'r') as f:
-                        cached_data = json.load(f)
+                    with open(cache_path, 'rb') as f:
+                        cached_data = orjson.loads(f.read())
+                    analysis = cached_data.get('analysis')
+                    # Restore the row tables stored alongside the JSON envelope
+                    if analysis:
+                        table_dir = self._get_table_dir(study_id)
+                        for name, container, key in self._get_table_slots(analysis):
+                            value = container[key]
+                            if isinstance(value, dict) and '__feather__' in value:
+                                container[key] = feather.read_table(table_dir / value['__feather__']).to_pylist()
                     logger.info(f"Using cached analysis for study {study_id}")
-                    return cached_data.get('analysis')
+                    return analysis
                 else:
                     logger.info(f"Cache is older than source files for study {study_id}")
             except Exception as e:
@@ -117,12 +387,37 @@ class StudyAnalysisProcessor(StatisticsProcessor):
         """Save analysis results to cache file."""
         cache_path = self._get_cache_path(study_id)
         try:
-            with open(cache_path, 'w') as f:
-                json.dump({
-                    'analysis': analysis,
+            # Copy the containers of the row tables so the in-memory analysis is untouched
+            envelope = dict(analysis)
+            if isinstance(envelope.get('omics'), dict):
+                envelope['omics'] = dict(envelope['omics'])
+                envelope['omics']['outliers'] = dict(envelope['omics'].get('outliers', {}))
+            if isinstance(envelope.get('taxonomic'), dict):
+                envelope['taxonomic'] = dict(envelope['taxonomic'])
+                envelope['taxonomic']['outliers'] = {
+                    tax_type: dict(ranks) if isinstance(ranks, dict) else ranks
+                    for tax_type, ranks in envelope['taxonomic'].get('outliers', {}).items()
+                }
+            if isinstance(envelope.get('map_data'), dict):
+                envelope['map_data'] = dict(envelope['map_data'])
+            
+            # Write the row tables as Feather files; the JSON envelope only references them
+            cache_path.parent.mkdir(exist_ok=True)
+            table_dir = self._get_table_dir(study_id)
+            for name, container, key in self._get_table_slots(envelope):
+                table = self._rows_to_table(container[key])
+                if table is None:
+                    continue
+                table_dir.mkdir(exist_ok=True)
+                feather.write_feather(table, table_dir / f"{name}.feather")
+                container[key] = {'__feather__': f"{name}.feather"}
+            
+            with open(cache_path, 'wb') as f:
+                f.write(orjson.dumps({
+                    'analysis': envelope,
                     'last_file_modification': self.last_file_modification,
                     'cached_at': datetime.now().isoformat()
-                }, f)
+                }, default=str, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS))
             logger.info(f"Saved analysis to cache for study {study_id}")
         except Exception as e:
             logger.warning(f"Error saving cache for study {study_id}: {str(e)}")
@@ -132,13 +427,8 @@ class StudyAnalysisProcessor(StatisticsProcessor):
         data_files = [
             'sample_table_snappy.parquet',
             'study_table_snappy.parquet',
-            'metabolite_table_snappy.parquet',
-            'lipidomics_table_snappy.parquet',
-            'proteomics_table_snappy.parquet',
-            'gottcha_table_snappy.parquet',
-            'kraken_table_snappy.parquet',
-            'centrifuge_rollup_table_snappy.parquet',
-            'contigs_rollup_table_snappy.parquet'
+            *(config['filename'] for config in OMICS_CONFIG.values()),
+            *(config['filename'] for config in TAXONOMIC_CONFIG.values())
         ]
         
         try:
@@ -147,8 +437,26 @@ class StudyAnalysisProcessor(StatisticsProcessor):
             logger.error(f"Error getting file modification times: {str(e)}")
             return 0.0
             
+    def _get_data_dir_modification(self) -> float:
+        """Get the modification time of the data directory itself."""
+        try:
+            return os.stat(self.data_dir).st_mtime
+        except OSError as e:
+            logger.error(f"Error getting data directory modification time: {str(e)}")
+            return 0.0
+            
     def _check_data_changes(self) -> None:
         """Check if any source data files have changed since last analysis."""
+        # Skip the per-file scan while the last one is recent and no file was
+        # added, removed or replaced in the data directory
+        checked_at = time.time()
+        data_dir_modification = self._get_data_dir_modification()
+        if (checked_at - self._modification_checked_at < MODIFICATION_CHECK_TTL
+                and data_dir_modification == self._data_dir_modification):
+            return
+        self._modification_checked_at = checked_at
+        self._data_dir_modification = data_dir_modification
+        
         current_modification = self._get_latest_file_modification()
         if current_modification > self.last_file_modification:
             logger.info("Source data files have changed, clearing cache")
@@ -159,56 +467,113 @@ class StudyAnalysisProcessor(StatisticsProcessor):
             # Force reload of data by setting to None
             self._study_df = None
             self._sample_df = None
+            self._study_sample_positions = None
+            self._omics_cache = {}
+            self._taxonomic_cache = {}
+            self._study_means = None
+            self._data_coverage = None
+    
+    def _load_sample_df(self) -> pd.DataFrame:
+        """Lazy load the full sample table, reusing it across studies."""
+        if self._sample_df is None:
+            sample_file = self.data_dir / "sample_table_snappy.parquet"
+            logger.info(f"Reading sample data from {sample_file}")
+            if not sample_file.exists():
+                raise FileNotFoundError(f"Sample data file not found: {sample_file}")
+            self._sample_df = pd.read_parquet(sample_file)
+            logger.info(f"Loaded sample data with {len(self._sample_df)} samples")
+        return self._sample_df
+    
+    def _get_loaded_study_samples(self, study_id: str) -> pd.DataFrame:
+        """Get the samples of a study from the loaded sample table via a cached study index."""
+        sample_df = self._load_sample_df()
+        if self._study_sample_positions is None:
+            # Group the sample rows by study once instead of scanning the table per study
+            self._study_sample_positions = sample_df.groupby('study_id', sort=False).indices
+        positions = self._study_sample_positions.get(study_id, np.array([], dtype=np.intp))
+        return sample_df.iloc[positions]
+    
+    def _load_omics(self, omics_type: str) -> pd.DataFrame:
+        """Lazy load the columns of an omics table used by the analysis."""
+        if omics_type not in self._omics_cache:
+            config = OMICS_CONFIG[omics_type]
+            omics_file = self.data_dir / config['filename']
+            # Read sample_id dictionary encoded so it arrives as a categorical and
+            # sample membership can be tested on the integer category codes
+            dataset = ds.dataset(omics_file, format=ds.ParquetFileFormat(dictionary_columns=['sample_id']))
+            wanted = ['sample_id', config['id_col'], config['value_col'], *config['additional_fields']]
+            columns = [col for col in wanted if col in dataset.schema.names]
+            table = dataset.to_table(columns=columns)
+            df = table.to_pandas(self_destruct=True, split_blocks=True)
+            # float32 halves the memory moved by the grouping and ranking passes
+            if config['value_col'] in df.columns:
+                df[config['value_col']] = pd.to_numeric(df[config['value_col']], downcast='float')
+            self._omics_cache[omics_type] = df
+            logger.info(f"Loaded {len(self._omics_cache[omics_type])} {omics_type} records")
+        return self._omics_cache[omics_type]
+            
+    def _load_taxonomic(self, tax_type: str) -> pd.DataFrame:
+        """Lazy load the columns of a taxonomic table used by the analysis."""
+        if tax_type not in self._taxonomic_cache:
+            config = TAXONOMIC_CONFIG[tax_type]
+            columns = ['sample_id', config['id_col'], config['value_col'], config['rank_col']]
+            # Sample IDs, taxon names and ranks are highly repeated, so read them as
+            # categoricals and let groupby and isin work on integer codes
+            df = pd.read_parquet(
+                self.data_dir / config['filename'],
+                columns=columns,
+                engine='pyarrow',
+                use_threads=True,
+                read_dictionary=['sample_id', config['id_col'], config['rank_col']]
+            )
+            # float32 halves the memory moved by the grouping and ranking passes
+            df[config['value_col']] = pd.to_numeric(df[config['value_col']], downcast='float')
+            self._taxonomic_cache[tax_type] = df
+            logger.info(f"Loaded {len(self._taxonomic_cache[tax_type])} {tax_type} records")
+        return self._taxonomic_cache[tax_type]
+    
+    def _load_taxonomic_study(self, tax_type: str, study_sample_ids: pd.Index) -> pd.DataFrame:
+        """Select the rows of a cached taxonomic table that belong to the given samples."""
+        # The outliers component loads the full table in the same request, so filtering
+        # the cached table is cheaper than a second, filtered decode of the file
+        df = self._load_taxonomic(tax_type)
+        return df[self._get_study_mask(df, study_sample_ids)]
+    
+    def _get_study_mask(self, df: pd.DataFrame, study_sample_ids: Union[List[str], pd.Index]) -> np.ndarray:
+        """Boolean mask of the rows of a cached omics or taxonomic table that belong to the study samples."""
+        sample_ids = df['sample_id'].cat
+        study_codes = sample_ids.categories.get_indexer(study_sample_ids)
+        return np.isin(sample_ids.codes.to_numpy(), study_codes[study_codes >= 0])
             
     def _get_study_samples(self, study_id: str) -> pd.DataFrame:
         """Get all samples for a specific study."""
-        sample_df = pd.read_parquet(self.data_dir / "sample_table_snappy.parquet")
-        return sample_df[sample_df['study_id'] == study_id]
+        if self._sample_df is not None:
+            return self._get_loaded_study_samples(study_id)
+        # Standalone callers that never need the full table push the study filter down
+        # to the parquet reader so row groups without this study are skipped
+        return pd.read_parquet(
+            self.data_dir / "sample_table_snappy.parquet",
+            engine='pyarrow',
+            filters=[('study_id', '==', study_id)]
+        )
         
     def get_study_samples(self, study_id: str) -> List[Dict]:
         """Get all samples for a specific study."""
         try:
             logger.info(f"Loading sample data for study {study_id}")
-            # Load sample data if not already loaded
-            if self._sample_df is None:
-                sample_file = self.data_dir / "sample_table_snappy.parquet"
-                logger.info(f"Reading sample data from {sample_file}")
-                if not sample_file.exists():
-                    raise FileNotFoundError(f"Sample data file not found: {sample_file}")
-                self._sample_df = pd.read_parquet(sample_file)
-                logger.info(f"Loaded sample data with {len(self._sample_df)} samples")
-            
-            # Filter samples for the study
-            study_samples = self._sample_df[self._sample_df['study_id'] == study_id]
+            # Load sample data if not already loaded and take the study's samples
+            study_samples = self._get_loaded_study_samples(study_id)
             logger.info(f"Found {len(study_samples)} samples for study {study_id}")
             
             if len(study_samples) == 0:
                 logger.warning(f"No samples found for study {study_id}")
                 return []
             
-            # Convert to list of dictionaries
-            samples = []
-            for _, sample in study_samples.iterrows():
-                try:
-                    sample_dict = sample.to_dict()
-                    # Convert numpy types to Python native types and handle out of range values
-                    for key, value in sample_dict.items():
-                        if pd.isna(value):
-                            sample_dict[key] = None
-                        elif isinstance(value, (np.floating, float)):
-                            if value in (np.inf, -np.inf, float('inf'), float('-inf')):
-                                sample_dict[key] = None
-                            else:
-                                sample_dict[key] = float(value)
-                        elif isinstance(value, (np.integer, int)):
-                            sample_dict[key] = int(value)
-                        elif isinstance(value, (np.bool_, bool)):
-                            sample_dict[key] = bool(value)
-                    
-                    samples.append(sample_dict)
-                except Exception as e:
-                    logger.error(f"Error processing sample {sample.get('id', 'unknown')}: {str(e)}")
-                    continue
+            # Convert to list of dictionaries with native Python values; missing and
+            # infinite values become None
+            clean = study_samples.replace([np.inf, -np.inf], np.nan)
+            clean = clean.astype(object).where(clean.notna(), None)
+            samples = clean.to_dict(orient='records')
             
             logger.info(f"Successfully processed {len(samples)} samples for study {study_id}")
             return samples
@@ -216,6 +581,31 @@ class StudyAnalysisProcessor(StatisticsProcessor):
             logger.error(f"Error getting samples for study {study_id}: {str(e)}")
             raise
         
+    def _process_components(self, study_id: str, study_samples: pd.DataFrame) -> Dict:
+        """Run the seven independent analysis components in threads over the shared cached tables."""
+        tasks = {
+            'physical': self._process_physical_variables,
+            'omics': self._process_omics,
+            'taxonomic_top10': self._process_taxonomic_top10,
+            'taxonomic_outliers': self._process_taxonomic_outliers,
+            'timeline': self._process_timeline,
+            'ecosystem': self._process_ecosystem,
+            'map_data': self._process_map_data
+        }
+        # Warm the tables shared by several components so no two threads load them at once;
+        # both taxonomic components read every taxonomic table, the omics tables are only
+        # loaded by the omics component
+        self._load_sample_df()
+        self._get_study_means()
+        for tax_type in TAXONOMIC_CONFIG:
+            self._load_taxonomic(tax_type)
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = {
+                name: executor.submit(task, study_id, study_samples)
+                for name, task in tasks.items()
+            }
+            return {name: future.result() for name, future in futures.items()}
+        
     def get_study_analysis(self, study_id: str) -> Dict:
         """Get complete analysis for a specific study."""
         # Check if we need to recalculate everything
@@ -232,8 +622,9 @@ class StudyAnalysisProcessor(StatisticsProcessor):
             return cached_analysis
             
         try:
-            # Get study samples
-            study_samples = self._get_study_samples(study_id)
+            # Get study samples from the full sample table, which the components need anyway
+            self._load_sample_df()
+            study_samples = self._get_loaded_study_samples(study_id)
             
             # Verify study exists
             if len(study_samples) == 0:
@@ -262,24 +653,22 @@ class StudyAnalysisProcessor(StatisticsProcessor):
                 logger.info(f"  Ecosystem: {study_info.get('ecosystem')}")
             
             # Process all components
+            components = self._process_components(study_id, study_samples)
             analysis = {
                 'id': study_id,
                 'name': (study_info.get('name') if study_info is not None else None) or (study_card.get('name') if study_card is not None else None) or 'Unnamed Study',
                 'description': (study_info.get('description') if study_info is not None else None) or (study_card.get('description') if study_card is not None else None) or 'No description available',
                 'ecosystem': (study_info.get('ecosystem') if study_info is not None else None) or (study_card.get('ecosystem') if study_card is not None else None) or 'Unknown',
                 'sample_count': len(study_samples),
-                'physical': self._process_physical_variables(study_id, study_samples),
-                'omics': {
-                    'top10': self._process_omics_top10(study_id, study_samples),
-                    'outliers': self._process_omics_outliers(study_id, study_samples)
-                },
+                'physical': components['physical'],
+                'omics': components['omics'],
                 'taxonomic': {
-                    'top10': self._process_taxonomic_top10(study_id, study_samples),
-                    'outliers': self._process_taxonomic_outliers(study_id, study_samples)
+                    'top10': components['taxonomic_top10'],
+                    'outliers': components['taxonomic_outliers']
                 },
-                'timeline': self._process_timeline(study_id, study_samples),
-                'ecosystem': self._process_ecosystem(study_id, study_samples),
-                'map_data': self._process_map_data(study_id, study_samples)
+                'timeline': components['timeline'],
+                'ecosystem': components['ecosystem'],
+                'map_data': components['map_data']
             }
             
             # Add any additional metadata from study card
@@ -301,7 +690,7 @@ class StudyAnalysisProcessor(StatisticsProcessor):
             # Cache the results in memory and on disk
             self.cache[study_id] = analysis
             self._save_to_cache(study_id, analysis)
-            return convert_numpy_types(analysis)
+            return analysis
             
         except Exception as e:
             logger.error(f"Error processing study {study_id}: {str(e)}")
@@ -312,7 +701,7 @@ class StudyAnalysisProcessor(StatisticsProcessor):
         logger.info(f"Processing physical variables for study {study_id}")
         
         # Get all samples for compendium comparison
-        all_samples = pd.read_parquet(self.data_dir / "sample_table_snappy.parquet")
+        all_samples = self._load_sample_df()
         
         # Exclude study samples from compendium and ensure we have study_id
         if 'study_id' not in all_samples.columns:
@@ -324,97 +713,26 @@ class StudyAnalysisProcessor(StatisticsProcessor):
         logger.info(f"Total samples in compendium: {len(compendium_samples)}")
         logger.info(f"Number of studies in compendium: {compendium_samples['study_id'].nunique()}")
         
-        # Define physical variables to check
-        physical_variables = [
-            # Nitrogen-related variables
-            'ammonium_has_numeric_value',
-            'ammonium_nitrogen_has_numeric_value',
-            'ammonium_nitrogen_numeric',
-            'nitrate_nitrogen_numeric',
-            'nitrite_nitrogen_numeric',
-            'nitro_has_numeric_value',
-            'tot_nitro_content_has_numeric_value',
-            'tot_nitro_numeric',
-            'diss_inorg_nitro_has_numeric_value',
-            
-            # Carbon-related variables
-            'tot_carb',
-            'diss_inorg_carb_has_numeric_value',
-            'diss_org_carb_has_numeric_value',
-            'org_carb_has_numeric_value',
-            'carb_nitro_ratio',
-            'carb_nitro_ratio_has_numeric_value',
-            
-            # Mineral and metal variables
-            'calcium_has_numeric_value',
-            'calcium_numeric',
-            'magnesium_has_numeric_value',
-            'magnesium_numeric',
-            'manganese_has_numeric_value',
-            'manganese_numeric',
-            'zinc_numeric',
-            'diss_iron_has_numeric_value',
-            'potassium_has_numeric_value',
-            'potassium_numeric',
-            'sodium_has_numeric_value',
-            'chloride_has_numeric_value',
-            'sulfate_has_numeric_value',
-            
-            # Phosphorus-related variables
-            'tot_phosp_has_numeric_value',
-            'tot_phosp_numeric',
-            'soluble_react_phosp_has_numeric_value',
-            
-            # Physical parameters
-            'ph',
-            'temp_has_numeric_value',
-            'conduc_has_numeric_value',
-            'diss_oxygen_has_numeric_value',
-            'chlorophyll_has_numeric_value',
-            'water_content_numeric',
-            
-            # Depth and size measurements
-            'depth',
-            'depth_has_numeric_value',
-            'depth_has_maximum_numeric_value',
-            'depth_has_minimum_numeric_value',
-            'samp_size_numeric',
-            'samp_size_has_numeric_value',
-            
-            # Environmental measurements
-            'abs_air_humidity',
-            'avg_temp',
-            'humidity',
-            'latitude',
-            'longitude',
-            'photon_flux',
-            'solar_irradiance',
-            'wind_speed',
-            
-            # Other measurements
-            'host_age_numeric',
-            'lbc_thirty_numeric',
-            'lbceq_numeric'
-        ]
+        
+        # Skip variables not in columns, then convert everything to numeric at once,
+        # coercing errors to NaN and downcasting to float32 where values allow
+        variables = [variable for variable in PHYSICAL_VARIABLES if variable in study_samples.columns]
+        study_numeric = study_samples[variables].apply(pd.to_numeric, errors='coerce', downcast='float')
+        compendium_numeric = compendium_samples[variables].apply(pd.to_numeric, errors='coerce', downcast='float')
+        
+        # Per-study means are shared across studies; only the current study is left out
+        compendium_study_means = self._get_study_means()[variables].drop(index=study_id, errors='ignore')
         
         results = {}
-        for variable in physical_variables:
+        for variable in variables:
             try:
-                # Skip if variable not in columns
-                if variable not in study_samples.columns:
-                    continue
-                    
-                # Convert to numeric, coercing errors to NaN
-                study_values = pd.to_numeric(study_samples[variable], errors='coerce').dropna()
+                study_values = study_numeric[variable].dropna()
+                study_array = study_values.to_numpy()
                 if len(study_values) == 0:
                     continue
                     
-                # Convert compendium values to numeric and calculate per-study means first
-                compendium_values = pd.to_numeric(compendium_samples[variable], errors='coerce')
-                
-                # Calculate mean per study in compendium
-                study_means = compendium_values.groupby(compendium_samples['study_id']).mean()
-                study_means = study_means.dropna()  # Remove studies with no valid values
+                compendium_values = compendium_numeric[variable].to_numpy()
+                study_means = compendium_study_means[variable].dropna()  # Remove studies with no valid values
                 
                 if len(study_means) == 0:
                     logger.warning(f"No valid compendium data for {variable}")
@@ -438,7 +756,7 @@ class StudyAnalysisProcessor(StatisticsProcessor):
                 
                 # Perform Mann-Whitney U test
                 try:
-                    stat, p_value = mannwhitneyu(study_values, compendium_values, alternative='two-sided')
+                    stat, p_value = mannwhitneyu(study_array, compendium_values, alternative='two-sided', method='asymptotic')
                     significant = bool(p_value < 0.05)  # Convert numpy.bool_ to Python bool
                 except Exception as e:
                     logger.warning(f"Error in Mann-Whitney U test for {variable}: {str(e)}")
@@ -446,7 +764,7 @@ class StudyAnalysisProcessor(StatisticsProcessor):
                     significant = False
                 
                 # Calculate effect size (Cliff's delta)
-                effect_size = self._calculate_cliffs_delta(study_values, compendium_values)
+                effect_size = self._calculate_cliffs_delta(study_array, compendium_values)
                 
                 results[variable] = {
                     'status': 'ok',
@@ -472,471 +790,441 @@ class StudyAnalysisProcessor(StatisticsProcessor):
         
         return results
     
-    def _calculate_cliffs_delta(self, group1: pd.Series, group2: pd.Series) -> float:
+    def _get_study_means(self) -> pd.DataFrame:
+        """Lazy compute the mean of each physical variable per study over the whole compendium."""
+        if self._study_means is None:
+            all_samples = self._load_sample_df()
+            variables = [variable for variable in PHYSICAL_VARIABLES if variable in all_samples.columns]
+            numeric = all_samples[variables].apply(pd.to_numeric, errors='coerce', downcast='float')
+            self._study_means = numeric.groupby(all_samples['study_id']).mean()
+        return self._study_means
+    
+    def _calculate_cliffs_delta(self, group1: Union[pd.Series, np.ndarray], group2: Union[pd.Series, np.ndarray]) -> float:
         """Calculate Cliff's delta effect size between two groups."""
         n1, n2 = len(group1), len(group2)
         if n1 == 0 or n2 == 0:
             return 0.0
-            
-        # Count how many times values in group1 are greater than values in group2
+        
+        # NaNs never compare greater, so they only count towards n1 and n2
+        x = np.asarray(group1, dtype=np.float64)
+        y = np.asarray(group2, dtype=np.float64)
+        x = x[~np.isnan(x)]
+        y = y[~np.isnan(y)]
+        
+        # Count how many times values in group1 are greater than values in group2:
+        # the left insertion point of each x in the sorted y is the number of
+        # values of group2 strictly below it, in O((n1 + n2) log n2)
         greater = 0
-        for x in group1:
-            greater += sum(x > y for y in group2)
+        if len(x) > 0 and len(y) > 0:
+            greater = int(np.searchsorted(np.sort(y), x, side='left').sum())
             
         # Calculate delta
         delta = (2 * greater - n1 * n2) / (n1 * n2)
         return float(delta)
         
-    def _process_omics_top10(self, study_id: str, study_samples: pd.DataFrame) -> Dict:
-        """Process top 10 most abundant omics for a study."""
-        logger.info(f"Processing top 10 omics for study {study_id}")
-        results = {}
+    def _get_group_stats(self, df: pd.DataFrame, id_col: str, value_col: str) -> pd.DataFrame:
+        """Mean, sample std and row count of a value column per group, aggregated in Arrow."""
+        # NaN values become nulls, which Arrow skips just like pandas does
+        table = pa.Table.from_pandas(df[[id_col, value_col]], preserve_index=False)
+        stats = table.group_by(id_col).aggregate([
+            (value_col, 'mean'),
+            (value_col, 'stddev', pc.VarianceOptions(ddof=1)),
+            (value_col, 'count', pc.CountOptions(mode='all'))
+        ]).to_pandas()
+        stats = stats.set_index(id_col)
+        return stats[[f'{value_col}_mean', f'{value_col}_stddev', f'{value_col}_count']].set_axis(['mean', 'std', 'size'], axis=1)
+        
+    def _mannwhitneyu_by_group(self, study_df: pd.DataFrame, compendium_df: pd.DataFrame,
+                               id_col: str, value_col: str, groups: pd.Index) -> pd.Series:
+        """Two-sided asymptotic Mann-Whitney U p-values for every group."""
+        study = study_df.loc[study_df[id_col].isin(groups), [id_col, value_col]]
+        compendium = compendium_df.loc[compendium_df[id_col].isin(groups), [id_col, value_col]]
+        combined = pd.concat([study.assign(in_study=True), compendium.assign(in_study=False)], ignore_index=True)
+        
+        # Rank once within each group; U follows from the rank sum of the study values
+        combined['rank'] = combined.groupby(id_col, observed=True)[value_col].rank()
+        n1 = study.groupby(id_col, observed=True).size().reindex(groups).astype(np.float64)
+        n2 = compendium.groupby(id_col, observed=True).size().reindex(groups).astype(np.float64)
+        rank_sum = combined[combined['in_study']].groupby(id_col, observed=True)['rank'].sum().reindex(groups)
+        u1 = rank_sum - n1 * (n1 + 1) / 2
+        u = np.maximum(u1, n1 * n2 - u1)
+        
+        # Normal approximation with tie and continuity correction
+        tie_counts = combined.groupby([id_col, value_col], observed=True).size()
+        tie_term = (tie_counts ** 3 - tie_counts).groupby(level=0, observed=True).sum().reindex(groups, fill_value=0)
+        n = n1 + n2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            s = np.sqrt(n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1))))
+            z = (u - n1 * n2 / 2 - 0.5) / s
+        p_values = pd.Series(np.clip(2 * norm.sf(z), 0, 1), index=groups)
+        
+        # Like scipy, groups containing NaN get a NaN p-value
+        has_nan = combined[value_col].isna().groupby(combined[id_col], observed=True).any().reindex(groups, fill_value=False)
+        p_values[has_nan] = np.nan
+        return p_values
+        
+    def _cliffs_delta_by_group(self, study_df: pd.DataFrame, compendium_df: pd.DataFrame,
+                               id_col: str, value_col: str, groups: pd.Index) -> pd.Series:
+        """Cliff's delta of the study against the compendium values for every group."""
+        study = study_df.loc[study_df[id_col].isin(groups), [id_col, value_col]]
+        compendium = compendium_df.loc[compendium_df[id_col].isin(groups), [id_col, value_col]]
+        combined = pd.concat([study, compendium], ignore_index=True)
+        
+        # The minimum rank of a study value among all values, less its minimum rank
+        # among the study values, is the number of compendium values strictly below it
+        combined_ranks = combined.groupby(id_col, observed=True)[value_col].rank(method='min').to_numpy()[:len(study)]
+        study_ranks = study.groupby(id_col, observed=True)[value_col].rank(method='min').to_numpy()
+        greater = pd.Series(combined_ranks - study_ranks).groupby(study[id_col].to_numpy()).sum().reindex(groups, fill_value=0)
+        
+        # NaNs have no rank, so they only count towards n1 and n2
+        n1 = study.groupby(id_col, observed=True).size().reindex(groups).astype(np.float64)
+        n2 = compendium.groupby(id_col, observed=True).size().reindex(groups).astype(np.float64)
+        return (2 * greater - n1 * n2) / (n1 * n2)
+        
+    def _process_omics(self, study_id: str, study_samples: pd.DataFrame) -> Dict:
+        """Process top 10 and significantly different omics for a study in one pass per omics type."""
+        logger.info(f"Processing omics for study {study_id}")
+        results = {'top10': {}, 'outliers': {}}
         
         # Get study sample IDs from the sample table
         study_sample_ids = study_samples['id'].tolist()
         logger.info(f"Found {len(study_sample_ids)} sample IDs for study {study_id}")
         
         # Process each omics type
-        for omics_type in ['metabolomics', 'lipidomics', 'proteomics']:
+        for omics_type, config in OMICS_CONFIG.items():
+            results['top10'][omics_type] = []
+            results['outliers'][omics_type] = []
             try:
-                # Load omics data
-                if omics_type == 'metabolomics':
-                    df = pd.read_parquet(self.data_dir / "metabolite_table_snappy.parquet")
-                    id_col = 'Compound Name'
-                    value_col = 'Peak Area'
-                    # Define additional fields for metabolomics
-                    additional_fields = {
-                        'Common Name': 'common_name',
-                        'IUPAC Name': 'iupac_name',
-                        'Traditional Name': 'traditional_name',
-                        'Molecular Formula': 'molecular_formula',
-                        'ChEBI ID': 'chebi_id',
-                        'KEGG Compound ID': 'kegg_compound_id'
-                    }
-                elif omics_type == 'lipidomics':
-                    df = pd.read_parquet(self.data_dir / "lipidomics_table_snappy.parquet")
-                    id_col = 'Lipid Molecular Species'
-                    value_col = 'Area'
-                    # Define additional fields for lipidomics
-                    additional_fields = {
-                        'Lipid Class': 'lipid_class',
-                        'Lipid Category': 'lipid_category'
-                    }
-                else:  # proteomics
-                    df = pd.read_parquet(self.data_dir / "proteomics_table_snappy.parquet")
-                    id_col = 'Product'
-                    value_col = 'SummedPeptideMASICAbundances'
-                    # Define additional fields for proteomics
-                    additional_fields = {
-                        'EC_Number': 'ec_number',
-                        'pfam': 'pfam',
-                        'KO': 'ko',
-                        'COG': 'cog',
-                        'GeneCount': 'gene_count',
-                        'UniquePeptideCount': 'unique_peptide_count'
-                    }
-                
-                # Filter for study samples using exact sample IDs
-                study_df = df[df['sample_id'].isin(study_sample_ids)]
+                # Load omics data and split it into study and compendium samples once
+                df = self._load_omics(omics_type)
+                study_mask = self._get_study_mask(df, study_sample_ids)
+                study_df = df[study_mask]
+                compendium_df = df[~study_mask]
                 logger.info(f"Found {len(study_df)} {omics_type} records for study {study_id}")
                 if len(study_df) == 0:
                     logger.warning(f"No {omics_type} data found for study {study_id}")
-                    results[omics_type] = []
                     continue
                 
-                # Prepare aggregation dictionary
-                agg_dict = {}
-                # Add value column aggregations
-                agg_dict[value_col] = ['mean', 'std', 'count']
-                # Add additional fields to aggregation
-                for field, _ in additional_fields.items():
-                    if field in study_df.columns:
-                        agg_dict[field] = 'first'  # Use string directly for single aggregation
-                
-                # Calculate statistics per compound
-                compound_stats = study_df.groupby(id_col).agg(agg_dict)
-                # Flatten column names
-                compound_stats.columns = [f"{col[0]}_{col[1]}" if isinstance(col, tuple) else col for col in compound_stats.columns]
-                compound_stats = compound_stats.sort_values(f'{value_col}_mean', ascending=False)
-                
-                # Get top 10 compounds
-                top10 = []
-                for compound, stats in compound_stats.head(10).iterrows():
-                    item = {
-                        'id': str(compound),
-                        'mean_abundance': float(stats[f'{value_col}_mean']),
-                        'std_abundance': float(stats[f'{value_col}_std']),
-                        'sample_count': int(stats[f'{value_col}_count'])
-                    }
-                    
-                    # Add additional fields
-                    for field, key in additional_fields.items():
-                        if f'{field}_first' in stats:
-                            value = stats[f'{field}_first']
-                            if pd.isna(value):
-                                item[key] = '' if isinstance(value, str) else 0
-                            else:
-                                item[key] = str(value) if isinstance(value, str) else int(value)
-                    
-                    top10.append(item)
-                
-                results[omics_type] = top10
-                
+                # Statistics and first annotation values per compound, shared by both results
+                study_groups = study_df.groupby(config['id_col'], sort=False)
+                study_stats = study_groups[config['value_col']].agg(['mean', 'std', 'count', 'size'])
+                fields = [field for field in config['additional_fields'] if field in study_df.columns]
+                first_values = study_groups[fields].first()
+            except Exception as e:
+                logger.error(f"Error loading {omics_type} data: {str(e)}")
+                continue
+            
+            try:
+                results['top10'][omics_type] = self._get_omics_top10(study_stats, first_values, config)
             except Exception as e:
                 logger.error(f"Error processing {omics_type} top 10: {str(e)}")
-                results[omics_type] = []
-        
-        return results
-        
-    def _process_omics_outliers(self, study_id: str, study_samples: pd.DataFrame) -> Dict:
-        """Process all omics that are significantly different from compendium."""
-        logger.info(f"Processing omics differences for study {study_id}")
-        results = {}
-        
-        # Get study sample IDs from the sample table
-        study_sample_ids = study_samples['id'].tolist()
-        
-        # Process each omics type
-        for omics_type in ['metabolomics', 'lipidomics', 'proteomics']:
+            
             try:
-                # Load omics data
-                if omics_type == 'metabolomics':
-                    df = pd.read_parquet(self.data_dir / "metabolite_table_snappy.parquet")
-                    id_col = 'Compound Name'
-                    value_col = 'Peak Area'
-                    # Define additional fields for metabolomics
-                    additional_fields = {
-                        'Common Name': 'common_name',
-                        'IUPAC Name': 'iupac_name',
-                        'Traditional Name': 'traditional_name',
-                        'Molecular Formula': 'molecular_formula',
-                        'ChEBI ID': 'chebi_id',
-                        'KEGG Compound ID': 'kegg_compound_id'
-                    }
-                elif omics_type == 'lipidomics':
-                    df = pd.read_parquet(self.data_dir / "lipidomics_table_snappy.parquet")
-                    id_col = 'Lipid Molecular Species'
-                    value_col = 'Area'
-                    # Define additional fields for lipidomics
-                    additional_fields = {
-                        'Lipid Class': 'lipid_class',
-                        'Lipid Category': 'lipid_category'
-                    }
-                else:  # proteomics
-                    df = pd.read_parquet(self.data_dir / "proteomics_table_snappy.parquet")
-                    id_col = 'Product'
-                    value_col = 'SummedPeptideMASICAbundances'
-                    # Define additional fields for proteomics
-                    additional_fields = {
-                        'EC_Number': 'ec_number',
-                        'pfam': 'pfam',
-                        'KO': 'ko',
-                        'COG': 'cog',
-                        'GeneCount': 'gene_count',
-                        'UniquePeptideCount': 'unique_peptide_count'
-                    }
-                
-                # Filter for study samples and compendium samples
-                study_df = df[df['sample_id'].isin(study_sample_ids)]
-                compendium_df = df[~df['sample_id'].isin(study_sample_ids)]
-                
-                if len(study_df) == 0:
-                    logger.warning(f"No {omics_type} data found for study {study_id}")
-                    results[omics_type] = []
-                    continue
-                
-                # Calculate statistics per compound
-                significant_differences = []
-                unique_compounds = study_df[id_col].unique()
-                logger.info(f"Analyzing {len(unique_compounds)} {omics_type} compounds for significant differences")
-                
-                for compound in unique_compounds:
-                    # Get study values
-                    study_values = study_df[study_df[id_col] == compound][value_col]
-                    if len(study_values) == 0:
-                        continue
-                        
-                    # Get compendium values
-                    compendium_values = compendium_df[compendium_df[id_col] == compound][value_col]
-                    if len(compendium_values) == 0:
-                        continue
-                    
-                    # Calculate study statistics
-                    study_mean = float(study_values.mean())
-                    study_std = float(study_values.std())
-                    study_count = int(len(study_values))
-                    
-                    # Calculate compendium statistics
-                    compendium_mean = float(compendium_values.mean())
-                    compendium_std = float(compendium_values.std())
-                    compendium_count = int(len(compendium_values))
-                    
-                    # Perform Mann-Whitney U test
-                    try:
-                        stat, p_value = mannwhitneyu(study_values, compendium_values, alternative='two-sided')
-                        significant = bool(p_value < 0.05)
-                    except Exception as e:
-                        logger.warning(f"Error in Mann-Whitney U test for {compound}: {str(e)}")
-                        p_value = 1.0
-                        significant = False
-                    
-                    # Calculate effect size
-                    effect_size = self._calculate_cliffs_delta(study_values, compendium_values)
-                    
-                    # Include if significant
-                    if significant:
-                        item = {
-                            'id': str(compound),
-                            'mean_abundance': study_mean,
-                            'std_abundance': study_std,
-                            'sample_count': study_count,
-                            'compendium_mean': compendium_mean,
-                            'compendium_std': compendium_std,
-                            'compendium_count': compendium_count,
-                            'p_value': float(p_value),
-                            'effect_size': effect_size,
-                            'direction': 'higher' if effect_size > 0 else 'lower'
-                        }
-                        
-                        # Add additional fields from the first occurrence in study data
-                        compound_data = study_df[study_df[id_col] == compound].iloc[0]
-                        for field, key in additional_fields.items():
-                            if field in compound_data:
-                                value = compound_data[field]
-                                if pd.isna(value):
-                                    item[key] = '' if isinstance(value, str) else 0
-                                else:
-                                    item[key] = str(value) if isinstance(value, str) else int(value)
-                        
-                        significant_differences.append(item)
-                
-                # Sort by effect size magnitude
-                significant_differences.sort(key=lambda x: abs(x['effect_size']), reverse=True)
-                logger.info(f"Found {len(significant_differences)} significant differences in {omics_type}")
-                if significant_differences:
-                    top_effects = [f"{d['id']} ({d['effect_size']:.2f})" for d in significant_differences[:3]]
+                outliers = self._get_omics_outliers(study_df, compendium_df, study_stats, first_values, config)
+                logger.info(f"Found {len(outliers)} significant differences in {omics_type}")
+                if outliers:
+                    top_effects = [f"{d['id']} ({d['effect_size']:.2f})" for d in outliers[:3]]
                     logger.info(f"Top effect sizes: {top_effects}")
-                results[omics_type] = significant_differences
-                
+                results['outliers'][omics_type] = outliers
             except Exception as e:
                 logger.error(f"Error processing {omics_type} differences: {str(e)}")
-                results[omics_type] = []
         
         return results
         
+    def _get_omics_top10(self, study_stats: pd.DataFrame, first_values: pd.DataFrame, config: Dict) -> List[Dict]:
+        """Get the 10 most abundant compounds of a study."""
+        additional_fields = config['additional_fields']
+        
+        # Rank compounds by mean abundance, breaking ties by compound name
+        top_stats = study_stats.sort_index().sort_values('mean', ascending=False).head(10)
+        
+        top10 = []
+        for compound, stats in top_stats.iterrows():
+            item = {
+                'id': str(compound),
+                'mean_abundance': float(stats['mean']),
+                'std_abundance': float(stats['std']),
+                'sample_count': int(stats['count'])
+            }
+            
+            # Add additional fields
+            for field in first_values.columns:
+                value = first_values.at[compound, field]
+                key = additional_fields[field]
+                if pd.isna(value):
+                    item[key] = '' if isinstance(value, str) else 0
+                else:
+                    item[key] = str(value) if isinstance(value, str) else int(value)
+            
+            top10.append(item)
+        
+        return top10
+        
+    def _get_omics_outliers(self, study_df: pd.DataFrame, compendium_df: pd.DataFrame,
+                            study_stats: pd.DataFrame, first_values: pd.DataFrame, config: Dict) -> List[Dict]:
+        """Get the compounds of a study that differ significantly from the compendium."""
+        id_col = config['id_col']
+        value_col = config['value_col']
+        additional_fields = config['additional_fields']
+        logger.info(f"Analyzing {len(study_stats)} compounds for significant differences")
+        
+        # Only compounds measured in both the study and the compendium are compared
+        compendium_stats = self._get_group_stats(compendium_df, id_col, value_col)
+        study_stats = study_stats[study_stats.index.isin(compendium_stats.index)]
+        compendium_stats = compendium_stats.loc[study_stats.index]
+        if len(study_stats) == 0:
+            return []
+        
+        # Perform Mann-Whitney U tests for all compounds at once
+        p_values = self._mannwhitneyu_by_group(study_df, compendium_df, id_col, value_col, study_stats.index)
+        
+        # Calculate effect sizes for the significant compounds at once
+        significant = p_values.index[p_values < 0.05]
+        effect_sizes = self._cliffs_delta_by_group(study_df, compendium_df, id_col, value_col, significant)
+        
+        significant_differences = []
+        for compound in significant:
+            study_stat = study_stats.loc[compound]
+            compendium_stat = compendium_stats.loc[compound]
+            effect_size = float(effect_sizes[compound])
+            
+            item = {
+                'id': str(compound),
+                'mean_abundance': float(study_stat['mean']),
+                'std_abundance': float(study_stat['std']),
+                'sample_count': int(study_stat['size']),
+                'compendium_mean': float(compendium_stat['mean']),
+                'compendium_std': float(compendium_stat['std']),
+                'compendium_count': int(compendium_stat['size']),
+                'p_value': float(p_values[compound]),
+                'effect_size': effect_size,
+                'direction': 'higher' if effect_size > 0 else 'lower'
+            }
+            
+            # Add additional fields from the first values in study data
+            for field in first_values.columns:
+                value = first_values.at[compound, field]
+                key = additional_fields[field]
+                if pd.isna(value):
+                    item[key] = '' if isinstance(value, str) else 0
+                else:
+                    item[key] = str(value) if isinstance(value, str) else int(value)
+            
+            significant_differences.append(item)
+        
+        # Sort by effect size magnitude
+        significant_differences.sort(key=lambda x: abs(x['effect_size']), reverse=True)
+        return significant_differences
+        
+    def _count_species_by_lineage(self, lineages: pd.Series) -> Counter:
+        """Count species rows under every ';'-delimited lineage prefix."""
+        species_counts = Counter()
+        lineage_counts = lineages.value_counts()
+        for lineage, count in lineage_counts[lineage_counts > 0].items():
+            parts = str(lineage).split(';')
+            for depth in range(1, len(parts) + 1):
+                species_counts[';'.join(parts[:depth])] += count
+        return species_counts
+        
     def _process_taxonomic_top10(self, study_id: str, study_samples: pd.DataFrame) -> Dict:
         """Process top 10 most abundant taxonomic data for a study."""
         logger.info(f"Processing top 10 taxonomic data for study {study_id}")
-        results = {}
         
-        # Get study sample IDs
-        study_sample_ids = study_samples['id'].tolist()
+        # Get study sample IDs as an index so isin reuses its hashtable
+        study_sample_ids = pd.Index(study_samples['id'].unique())
         
-        # Process each taxonomic type with progress bar
-        tax_types = ['gottcha', 'kraken', 'centrifuge', 'contigs']
-        for tax_type in tqdm(tax_types, desc="Processing taxonomic data", disable=not self.show_progress):
-            try:
-                # Load taxonomic data
-                if tax_type == 'gottcha':
-                    df = pd.read_parquet(self.data_dir / "gottcha_table_snappy.parquet")
-                    id_col = 'label'
-                    value_col = 'abundance'
-                    rank_col = 'rank'
-                elif tax_type == 'kraken':
-                    df = pd.read_parquet(self.data_dir / "kraken_table_snappy.parquet")
-                    id_col = 'name'
-                    value_col = 'abundance'
-                    rank_col = 'rank'
-                elif tax_type == 'centrifuge':
-                    df = pd.read_parquet(self.data_dir / "centrifuge_rollup_table_snappy.parquet")
-                    id_col = 'lineage'
-                    value_col = 'abundance'
-                    rank_col = 'rank'
-                else:  # contigs
-                    df = pd.read_parquet(self.data_dir / "contigs_rollup_table_snappy.parquet")
-                    id_col = 'lineage'
-                    value_col = 'abundance'
-                    rank_col = 'rank'
+        # Process the taxonomic types in parallel threads with progress bar
+        with ThreadPoolExecutor(max_workers=len(TAXONOMIC_CONFIG)) as executor:
+            futures = {
+                tax_type: executor.submit(self._process_taxonomic_top10_type, study_id, tax_type, study_sample_ids)
+                for tax_type in TAXONOMIC_CONFIG
+            }
+            return {
+                tax_type: future.result()
+                for tax_type, future in tqdm(futures.items(), desc="Processing taxonomic data", disable=not self.show_progress)
+            }
+        
+    def _process_taxonomic_top10_type(self, study_id: str, tax_type: str, study_sample_ids: pd.Index) -> Dict:
+        """Process the top 10 most abundant taxa of one taxonomic type for a study."""
+        cached_results = self._load_taxonomic_top10_cache(study_id, tax_type)
+        if cached_results is not None:
+            logger.info(f"Using cached {tax_type} top 10 for study {study_id}")
+            return cached_results
+        
+        results = {}
+        try:
+            # Load taxonomic data of the study samples
+            config = TAXONOMIC_CONFIG[tax_type]
+            study_df = self._load_taxonomic_study(tax_type, study_sample_ids)
+            id_col = config['id_col']
+            value_col = config['value_col']
+            rank_col = config['rank_col']
+            
+            if len(study_df) == 0:
+                logger.warning(f"No {tax_type} data found for study {study_id}")
+                return {}
+            
+            # Partition the study data by rank in a single pass
+            rank_groups = dict(list(study_df.groupby(rank_col, sort=False, observed=True)))
+            
+            # Count species-level lineages under each lineage prefix once
+            species_counts = None
+            if config['species_counts'] and 'species' in rank_groups:
+                species_counts = self._count_species_by_lineage(rank_groups['species'][id_col])
+            
+            # Process each rank
+            for rank in TAXONOMIC_RANKS:
+                # Data for this rank
+                rank_study_df = rank_groups.get(rank, study_df.iloc[:0])
                 
-                # Filter for study samples
-                study_df = df[df['sample_id'].isin(study_sample_ids)]
-                if len(study_df) == 0:
-                    logger.warning(f"No {tax_type} data found for study {study_id}")
-                    results[tax_type] = {}
+                if len(rank_study_df) == 0:
+                    results[rank] = []
                     continue
                 
-                # Initialize results dictionary for this taxonomic type
-                results[tax_type] = {}
+                # Calculate mean abundance per taxon
+                taxon_stats = rank_study_df.groupby(id_col, observed=True)[value_col].agg(['mean', 'std', 'count'])
+                taxon_stats = taxon_stats.sort_values('mean', ascending=False)
                 
-                # Process each rank
-                valid_ranks = ['superkingdom', 'phylum', 'class', 'order', 'family', 'genus', 'species']
-                for rank in valid_ranks:
-                    # Filter data for this rank
-                    rank_study_df = study_df[study_df[rank_col] == rank]
-                    
-                    if len(rank_study_df) == 0:
-                        results[tax_type][rank] = []
-                        continue
-                    
-                    # Calculate mean abundance per taxon
-                    taxon_stats = rank_study_df.groupby(id_col)[value_col].agg(['mean', 'std', 'count'])
-                    taxon_stats = taxon_stats.sort_values('mean', ascending=False)
+                # Get top 10 taxa
+                top10 = []
+                for taxon, stats in taxon_stats.head(10).iterrows():
+                    item = {
+                        'id': str(taxon),
+                        'mean_abundance': float(stats['mean']),
+                        'std_abundance': float(stats['std']),
+                        'sample_count': int(stats['count']),
+                        'rank': rank  # Add rank to each item
+                    }
                     
-                    # Get top 10 taxa
-                    top10 = []
-                    for taxon, stats in taxon_stats.head(10).iterrows():
-                        item = {
-                            'id': str(taxon),
-                            'mean_abundance': float(stats['mean']),
-                            'std_abundance': float(stats['std']),
-                            'sample_count': int(stats['count']),
-                            'rank': rank  # Add rank to each item
-                        }
-                        
-                        # Calculate species count statistics for this taxon
-                        if rank != 'species' and tax_type in ['contigs', 'centrifuge']:
-                            # Get all species-level lineages for this study
-                            species_df = study_df[study_df[rank_col] == 'species']
-                            if not species_df.empty:
-                                # Count species that contain this taxon in their lineage
-                                taxon_str = str(taxon)
-                                species_count = species_df[species_df[id_col].str.contains(taxon_str, regex=False)].shape[0]
-                                item.update({
-                                    'mean_species_count': float(species_count),
-                                    'std_species_count': 0.0  # Single value, so std is 0
-                                })
-                        
-                        top10.append(item)
+                    # Calculate species count statistics for this taxon
+                    if rank != 'species' and species_counts is not None:
+                        # Count species that contain this taxon in their lineage
+                        species_count = species_counts.get(str(taxon), 0)
+                        item.update({
+                            'mean_species_count': float(species_count),
+                            'std_species_count': 0.0  # Single value, so std is 0
+                        })
                     
-                    results[tax_type][rank] = top10
+                    top10.append(item)
                 
-            except Exception as e:
-                logger.error(f"Error processing {tax_type} top 10: {str(e)}")
-                results[tax_type] = {}
-        
-        return results
+                results[rank] = top10
+            
+            self._save_taxonomic_top10_cache(study_id, tax_type, results)
+            return results
+        except Exception as e:
+            logger.error(f"Error processing {tax_type} top 10: {str(e)}")
+            return {}
         
     def _process_taxonomic_outliers(self, study_id: str, study_samples: pd.DataFrame) -> Dict:
         """Process all taxa that are significantly different from compendium."""
         logger.info(f"Processing taxonomic differences for study {study_id}")
-        results = {}
         
-        # Get study sample IDs
-        study_sample_ids = study_samples['id'].tolist()
+        # Get study sample IDs as an index so isin reuses its hashtable
+        study_sample_ids = pd.Index(study_samples['id'].unique())
         
-        # Process each taxonomic type with progress bar
-        tax_types = ['gottcha', 'kraken', 'centrifuge', 'contigs']
-        for tax_type in tqdm(tax_types, desc="Processing taxonomic outliers", disable=not self.show_progress):
-            try:
-                # Load taxonomic data
-                if tax_type == 'gottcha':
-                    df = pd.read_parquet(self.data_dir / "gottcha_table_snappy.parquet")
-                    id_col = 'label'
-                    value_col = 'abundance'
-                    rank_col = 'rank'
-                elif tax_type == 'kraken':
-                    df = pd.read_parquet(self.data_dir / "kraken_table_snappy.parquet")
-                    id_col = 'name'
-                    value_col = 'abundance'
-                    rank_col = 'rank'
-                elif tax_type == 'centrifuge':
-                    df = pd.read_parquet(self.data_dir / "centrifuge_rollup_table_snappy.parquet")
-                    id_col = 'lineage'
-                    value_col = 'abundance'
-                    rank_col = 'rank'
-                else:  # contigs
-                    df = pd.read_parquet(self.data_dir / "contigs_rollup_table_snappy.parquet")
-                    id_col = 'lineage'
-                    value_col = 'abundance'
-                    rank_col = 'rank'
-                
-                # Filter for study samples and compendium samples
-                study_df = df[df['sample_id'].isin(study_sample_ids)]
-                compendium_df = df[~df['sample_id'].isin(study_sample_ids)]
+        # Process the taxonomic types in parallel threads with progress bar
+        with ThreadPoolExecutor(max_workers=len(TAXONOMIC_CONFIG)) as executor:
+            futures = {
+                tax_type: executor.submit(self._process_taxonomic_outliers_type, study_id, tax_type, study_sample_ids)
+                for tax_type in TAXONOMIC_CONFIG
+            }
+            return {
+                tax_type: future.result()
+                for tax_type, future in tqdm(futures.items(), desc="Processing taxonomic outliers", disable=not self.show_progress)
+            }
+        
+    def _process_taxonomic_outliers_type(self, study_id: str, tax_type: str, study_sample_ids: pd.Index) -> Dict:
+        """Process the taxa of one taxonomic type that differ significantly from the compendium."""
+        results = {}
+        try:
+            # Load taxonomic data
+            config = TAXONOMIC_CONFIG[tax_type]
+            df = self._load_taxonomic(tax_type)
+            id_col = config['id_col']
+            value_col = config['value_col']
+            rank_col = config['rank_col']
+            
+            # Filter for study samples and compendium samples
+            study_mask = self._get_study_mask(df, study_sample_ids)
+            study_df = df[study_mask]
+            compendium_df = df[~study_mask]
+            
+            if len(study_df) == 0:
+                logger.warning(f"No {tax_type} data found for study {study_id}")
+                return {}
+            
+            # Partition the study and compendium data by rank in a single pass each
+            study_rank_groups = dict(list(study_df.groupby(rank_col, sort=False, observed=True)))
+            compendium_rank_groups = dict(list(compendium_df.groupby(rank_col, sort=False, observed=True)))
+            
+            # Process each rank
+            for rank in TAXONOMIC_RANKS:
+                # Data for this rank
+                rank_study_df = study_rank_groups.get(rank, study_df.iloc[:0])
+                rank_compendium_df = compendium_rank_groups.get(rank, compendium_df.iloc[:0])
                 
-                if len(study_df) == 0:
-                    logger.warning(f"No {tax_type} data found for study {study_id}")
-                    results[tax_type] = {}
+                if len(rank_study_df) == 0:
+                    results[rank] = []
                     continue
                 
-                # Initialize results dictionary for this taxonomic type
-                results[tax_type] = {}
+                # Statistics of the taxa found in both the study and the compendium
+                study_stats = self._get_group_stats(rank_study_df, id_col, value_col)
+                compendium_stats = self._get_group_stats(rank_compendium_df, id_col, value_col)
+                merged = study_stats.join(compendium_stats, lsuffix='_study', rsuffix='_compendium', how='inner')
+                
+                # Mann-Whitney U test for all shared taxa at once
+                merged['p_value'] = self._mannwhitneyu_by_group(
+                    rank_study_df, rank_compendium_df, id_col, value_col, merged.index
+                )
+                significant_taxa = merged[merged['p_value'] < 0.05].copy()
                 
-                # Process each rank
-                valid_ranks = ['superkingdom', 'phylum', 'class', 'order', 'family', 'genus', 'species']
-                for rank in valid_ranks:
-                    # Filter data for this rank
-                    rank_study_df = study_df[study_df[rank_col] == rank]
-                    rank_compendium_df = compendium_df[compendium_df[rank_col] == rank]
+                # Cliff's delta for the significant taxa at once
+                significant_taxa['effect_size'] = self._cliffs_delta_by_group(
+                    rank_study_df, rank_compendium_df, id_col, value_col, significant_taxa.index
+                )
+                
+                # Describe each significant taxon
+                significant_differences = []
+                for stats in significant_taxa.itertuples():
+                    taxon = stats.Index
                     
-                    if len(rank_study_df) == 0:
-                        results[tax_type][rank] = []
-                        continue
+                    # Calculate study statistics
+                    study_mean = float(stats.mean_study)
+                    study_std = float(stats.std_study)
+                    study_count = int(stats.size_study)
+                    
+                    # Calculate compendium statistics
+                    compendium_mean = float(stats.mean_compendium)
+                    compendium_std = float(stats.std_compendium)
+                    compendium_count = int(stats.size_compendium)
                     
-                    # Calculate statistics per taxon with progress bar
-                    significant_differences = []
-                    unique_taxa = rank_study_df[id_col].unique()
-                    for taxon in tqdm(unique_taxa, desc=f"Processing {tax_type} {rank} taxa", disable=not self.show_progress):
-                        # Get study values
-                        study_values = rank_study_df[rank_study_df[id_col] == taxon][value_col]
-                        if len(study_values) == 0:
-                            continue
-                            
-                        # Get compendium values
-                        compendium_values = rank_compendium_df[rank_compendium_df[id_col] == taxon][value_col]
-                        if len(compendium_values) == 0:
-                            continue
-                        
-                        # Calculate study statistics
-                        study_mean = float(study_values.mean())
-                        study_std = float(study_values.std())
-                        study_count = int(len(study_values))
-                        
-                        # Calculate compendium statistics
-                        compendium_mean = float(compendium_values.mean())
-                        compendium_std = float(compendium_values.std())
-                        compendium_count = int(len(compendium_values))
-                        
-                        # Perform Mann-Whitney U test
-                        try:
-                            stat, p_value = mannwhitneyu(study_values, compendium_values, alternative='two-sided')
-                            significant = bool(p_value < 0.05)  # Convert numpy.bool_ to Python bool
-                        except Exception as e:
-                            logger.warning(f"Error in Mann-Whitney U test for {taxon}: {str(e)}")
-                            p_value = 1.0
-                            significant = False
-                        
-                        # Calculate effect size
-                        effect_size = self._calculate_cliffs_delta(study_values, compendium_values)
-                        
-                        # Include if significant
-                        if significant:
-                            significant_differences.append({
-                                'id': str(taxon),
-                                'mean_abundance': study_mean,
-                                'std_abundance': study_std,
-                                'sample_count': study_count,
-                                'compendium_mean': compendium_mean,
-                                'compendium_std': compendium_std,
-                                'compendium_count': compendium_count,
-                                'p_value': float(p_value),
-                                'effect_size': effect_size,
-                                'direction': 'higher' if effect_size > 0 else 'lower'
-                            })
+                    effect_size = float(stats.effect_size)
                     
-                    # Sort by effect size magnitude
-                    significant_differences.sort(key=lambda x: abs(x['effect_size']), reverse=True)
-                    logger.info(f"Found {len(significant_differences)} significant differences in {tax_type} {rank}")
-                    if significant_differences:
-                        top_effects = [f"{d['id']} ({d['effect_size']:.2f})" for d in significant_differences[:3]]
-                        logger.info(f"Top effect sizes: {top_effects}")
-                    results[tax_type][rank] = significant_differences
+                    significant_differences.append({
+                        'id': str(taxon),
+                        'mean_abundance': study_mean,
+                        'std_abundance': study_std,
+                        'sample_count': study_count,
+                        'compendium_mean': compendium_mean,
+                        'compendium_std': compendium_std,
+                        'compendium_count': compendium_count,
+                        'p_value': float(stats.p_value),
+                        'effect_size': effect_size,
+                        'direction': 'higher' if effect_size > 0 else 'lower'
+                    })
                 
-            except Exception as e:
-                logger.error(f"Error processing {tax_type} differences: {str(e)}")
-                results[tax_type] = {}
-        
-        return results
+                # Sort by effect size magnitude
+                significant_differences.sort(key=lambda x: abs(x['effect_size']), reverse=True)
+                logger.info(f"Found {len(significant_differences)} significant differences in {tax_type} {rank}")
+                if significant_differences:
+                    top_effects = [f"{d['id']} ({d['effect_size']:.2f})" for d in significant_differences[:3]]
+                    logger.info(f"Top effect sizes: {top_effects}")
+                results[rank] = significant_differences
+            
+            return results
+        except Exception as e:
+            logger.error(f"Error processing {tax_type} differences: {str(e)}")
+            return {}
         
     def _process_timeline(self, study_id: str, study_samples: pd.DataFrame) -> Dict:
         """Process timeline data for a study."""
@@ -958,21 +1246,16 @@ class StudyAnalysisProcessor(StatisticsProcessor):
             # Remove empty lists and None values
             ecosystem_data = {k: [v for v in vals if v is not None] for k, vals in ecosystem_data.items() if vals}
             
-            # Get the most common value for each ecosystem type
+            # Get the most common value and the sample counts for each ecosystem type
+            # from a single count of the column
             most_common: Dict[str, str] = {}
+            sample_counts: Dict[str, Dict[str, int]] = {}
             for col in ['ecosystem', 'ecosystem_category', 'ecosystem_type', 'ecosystem_subtype', 'specific_ecosystem']:
                 if col in study_samples.columns:
                     value_counts = study_samples[col].value_counts()
                     if not value_counts.empty:
                         most_common[col] = str(value_counts.index[0])
-            
-            # Get sample counts for each ecosystem type
-            sample_counts: Dict[str, Dict[str, int]] = {}
-            for col in ['ecosystem', 'ecosystem_category', 'ecosystem_type', 'ecosystem_subtype', 'specific_ecosystem']:
-                if col in study_samples.columns:
-                    # Calculate frequencies directly from the study samples
-                    value_counts = study_samples[col].value_counts()
-                    sample_counts[col] = {str(k): int(v) for k, v in value_counts.to_dict().items()}
+                    sample_counts[col] = {str(k): int(v) for k, v in value_counts.items()}
             
             # Get ecosystem statistics for each variable
             ecosystem_stats = {}
@@ -1026,195 +1309,90 @@ class StudyAnalysisProcessor(StatisticsProcessor):
         
         logger.info(f"Found {len(geo_samples)} samples with valid coordinates")
         
+        # Convert only the reported columns to native Python values through Arrow;
+        # missing and infinite values become None
+        columns = [column for column in MAP_SAMPLE_COLUMNS if column in geo_samples.columns]
+        clean = geo_samples[columns].replace([np.inf, -np.inf], np.nan)
+        records = pa.Table.from_pandas(clean, preserve_index=False).to_pylist()
+        
         # Create a list of individual sample locations
-        locations = []
-        for _, sample in geo_samples.iterrows():
-            # Convert all values to strings and handle NaN values
-            sample_dict = {}
-            for key, value in sample.items():
-                if pd.isna(value):
-                    sample_dict[key] = None
-                elif isinstance(value, (np.floating, float)):
-                    if value in (np.inf, -np.inf, float('inf'), float('-inf')):
-                        sample_dict[key] = None
-                    else:
-                        sample_dict[key] = float(value)
-                elif isinstance(value, (np.integer, int)):
-                    sample_dict[key] = int(value)
-                elif isinstance(value, (np.bool_, bool)):
-                    sample_dict[key] = bool(value)
-                else:
-                    sample_dict[key] = str(value)
-            
-            location = {
+        locations = [
+            {
                 'latitude': float(sample['latitude']),
                 'longitude': float(sample['longitude']),
                 'sample_count': 1,  # Each location represents one sample
-                'ecosystem': sample_dict.get('ecosystem'),
-                'ecosystem_type': sample_dict.get('ecosystem_type'),
-                'ecosystem_subtype': sample_dict.get('ecosystem_subtype'),
-                'specific_ecosystem': sample_dict.get('specific_ecosystem'),
+                'ecosystem': sample.get('ecosystem'),
+                'ecosystem_type': sample.get('ecosystem_type'),
+                'ecosystem_subtype': sample.get('ecosystem_subtype'),
+                'specific_ecosystem': sample.get('specific_ecosystem'),
                 'samples': [{
-                    'id': sample_dict.get('id', ''),
-                    'sample_name': sample_dict.get('sample_name', ''),
-                    'collection_date': sample_dict.get('collection_date', ''),
-                    'collection_time': sample_dict.get('collection_time', ''),
-                    'ecosystem': sample_dict.get('ecosystem', ''),
-                    'ecosystem_type': sample_dict.get('ecosystem_type', ''),
-                    'ecosystem_subtype': sample_dict.get('ecosystem_subtype', ''),
-                    'specific_ecosystem': sample_dict.get('specific_ecosystem', ''),
-                    'depth': sample_dict.get('depth'),
-                    'temperature': sample_dict.get('temp_has_numeric_value'),
-                    'ph': sample_dict.get('ph'),
-                    'salinity': sample_dict.get('salinity')
+                    'id': sample.get('id', ''),
+                    'sample_name': sample.get('sample_name', ''),
+                    'collection_date': sample.get('collection_date', ''),
+                    'collection_time': sample.get('collection_time', ''),
+                    'ecosystem': sample.get('ecosystem', ''),
+                    'ecosystem_type': sample.get('ecosystem_type', ''),
+                    'ecosystem_subtype': sample.get('ecosystem_subtype', ''),
+                    'specific_ecosystem': sample.get('specific_ecosystem', ''),
+                    'depth': sample.get('depth'),
+                    'temperature': sample.get('temp_has_numeric_value'),
+                    'ph': sample.get('ph'),
+                    'salinity': sample.get('salinity')
                 }]
             }
-            locations.append(location)
+            for sample in records
+        ]
         
         logger.info(f"Returning {len(locations)} locations")
         return {'locations': locations}
         
     def analyze_data_coverage(self) -> Dict:
         """Analyze data coverage across studies for omics, taxonomic, and physical data."""
+        # Reuse the coverage computed since the source files last changed
+        self._check_data_changes()
+        if self._data_coverage is not None:
+            self._cache_hits += 1
+            return self._data_coverage
         logger.info("Analyzing data coverage across studies...")
         
-        # Load all necessary data
+        # Load the samples and the sample IDs present in each data table
         sample_df = pd.read_parquet(self.data_dir / "sample_table_snappy.parquet")
-        metabolite_df = pd.read_parquet(self.data_dir / "metabolite_table_snappy.parquet")
-        lipidomics_df = pd.read_parquet(self.data_dir / "lipidomics_table_snappy.parquet")
-        proteomics_df = pd.read_parquet(self.data_dir / "proteomics_table_snappy.parquet")
-        gottcha_df = pd.read_parquet(self.data_dir / "gottcha_table_snappy.parquet")
-        kraken_df = pd.read_parquet(self.data_dir / "kraken_table_snappy.parquet")
-        centrifuge_df = pd.read_parquet(self.data_dir / "centrifuge_rollup_table_snappy.parquet")
-        contigs_df = pd.read_parquet(self.data_dir / "contigs_rollup_table_snappy.parquet")
-        
-        # Define physical variables to check
-        physical_variables = [
-            # Nitrogen-related variables
-            'ammonium_has_numeric_value',
-            'ammonium_nitrogen_has_numeric_value',
-            'ammonium_nitrogen_numeric',
-            'nitrate_nitrogen_numeric',
-            'nitrite_nitrogen_numeric',
-            'nitro_has_numeric_value',
-            'tot_nitro_content_has_numeric_value',
-            'tot_nitro_numeric',
-            'diss_inorg_nitro_has_numeric_value',
-            
-            # Carbon-related variables
-            'tot_carb',
-            'diss_inorg_carb_has_numeric_value',
-            'diss_org_carb_has_numeric_value',
-            'org_carb_has_numeric_value',
-            'carb_nitro_ratio',
-            'carb_nitro_ratio_has_numeric_value',
-            
-            # Mineral and metal variables
-            'calcium_has_numeric_value',
-            'calcium_numeric',
-            'magnesium_has_numeric_value',
-            'magnesium_numeric',
-            'manganese_has_numeric_value',
-            'manganese_numeric',
-            'zinc_numeric',
-            'diss_iron_has_numeric_value',
-            'potassium_has_numeric_value',
-            'potassium_numeric',
-            'sodium_has_numeric_value',
-            'chloride_has_numeric_value',
-            'sulfate_has_numeric_value',
-            
-            # Phosphorus-related variables
-            'tot_phosp_has_numeric_value',
-            'tot_phosp_numeric',
-            'soluble_react_phosp_has_numeric_value',
-            
-            # Physical parameters
-            'ph',
-            'temp_has_numeric_value',
-            'conduc_has_numeric_value',
-            'diss_oxygen_has_numeric_value',
-            'chlorophyll_has_numeric_value',
-            'water_content_numeric',
-            
-            # Depth and size measurements
-            'depth',
-            'depth_has_numeric_value',
-            'depth_has_maximum_numeric_value',
-            'depth_has_minimum_numeric_value',
-            'samp_size_numeric',
-            'samp_size_has_numeric_value',
-            
-            # Environmental measurements
-            'abs_air_humidity',
-            'avg_temp',
-            'humidity',
-            'latitude',
-            'longitude',
-            'photon_flux',
-            'solar_irradiance',
-            'wind_speed',
-            
-            # Other measurements
-            'host_age_numeric',
-            'lbc_thirty_numeric',
-            'lbceq_numeric'
-        ]
+        data_samples = {
+            data_type: pd.read_parquet(self.data_dir / OMICS_CONFIG[data_type]['filename'], columns=['sample_id'])['sample_id'].unique()
+            for data_type in OMICS_CONFIG
+        }
+        with ThreadPoolExecutor(max_workers=len(TAXONOMIC_CONFIG)) as executor:
+            taxonomic_dfs = executor.map(self._load_taxonomic, TAXONOMIC_CONFIG)
+            data_samples.update(
+                (tax_type, df['sample_id'].unique()) for tax_type, df in zip(TAXONOMIC_CONFIG, taxonomic_dfs)
+            )
         
-        # Get unique sample IDs with each data type
-        metabolite_samples = set(metabolite_df['sample_id'].unique())
-        lipidomics_samples = set(lipidomics_df['sample_id'].unique())
-        proteomics_samples = set(proteomics_df['sample_id'].unique())
-        gottcha_samples = set(gottcha_df['sample_id'].unique())
-        kraken_samples = set(kraken_df['sample_id'].unique())
-        centrifuge_samples = set(centrifuge_df['sample_id'].unique())
-        contigs_samples = set(contigs_df['sample_id'].unique())
+        # Count the samples of each study with each data type in one grouped pass
+        study_sample_ids = sample_df[['study_id', 'id']].drop_duplicates()
+        data_counts = study_sample_ids.assign(**{
+            data_type: study_sample_ids['id'].isin(sample_ids)
+            for data_type, sample_ids in data_samples.items()
+        }).groupby('study_id', sort=False)[list(data_samples)].sum()
+        data_counts['total_samples'] = study_sample_ids.groupby('study_id', sort=False).size()
         
-        # Create a mapping of sample IDs to study IDs
-        sample_to_study = dict(zip(sample_df['id'], sample_df['study_id']))
+        # Count the non-null values of each physical variable per study; count skips NaN
+        physical_columns = [var for var in PHYSICAL_VARIABLES if var in sample_df.columns]
+        physical_counts = sample_df.groupby('study_id', sort=False)[physical_columns].count()
+        physical_counts = physical_counts.reindex(columns=PHYSICAL_VARIABLES, fill_value=0).add_prefix('physical_')
         
         # Analyze coverage for each study
-        coverage = {}
-        for study_id in sample_df['study_id'].unique():
-            # Get all samples for this study
-            study_samples = sample_df[sample_df['study_id'] == study_id]
-            study_sample_ids = set(study_samples['id'])
-            
-            # Count samples with each data type
-            study_coverage = {
-                'metabolomics': len(study_sample_ids & metabolite_samples),
-                'lipidomics': len(study_sample_ids & lipidomics_samples),
-                'proteomics': len(study_sample_ids & proteomics_samples),
-                'gottcha': len(study_sample_ids & gottcha_samples),
-                'kraken': len(study_sample_ids & kraken_samples),
-                'centrifuge': len(study_sample_ids & centrifuge_samples),
-                'contigs': len(study_sample_ids & contigs_samples),
-                'total_samples': len(study_sample_ids)
-            }
-            
-            # Add physical variable coverage
-            for var in physical_variables:
-                if var in study_samples.columns:
-                    # All columns are treated as numeric - just check for non-null values
-                    valid_values = study_samples[var].notna()
-                    study_coverage[f'physical_{var}'] = int(valid_values.sum())
-                else:
-                    study_coverage[f'physical_{var}'] = 0
-            
-            coverage[study_id] = study_coverage
+        coverage_df = data_counts.join(physical_counts).astype(int)
+        coverage = coverage_df.to_dict(orient='index')
         
         # Calculate summary statistics
         summary = {
-            'metabolomics': sum(1 for c in coverage.values() if c['metabolomics'] > 0),
-            'lipidomics': sum(1 for c in coverage.values() if c['lipidomics'] > 0),
-            'proteomics': sum(1 for c in coverage.values() if c['proteomics'] > 0),
-            'gottcha': sum(1 for c in coverage.values() if c['gottcha'] > 0),
-            'kraken': sum(1 for c in coverage.values() if c['kraken'] > 0),
-            'centrifuge': sum(1 for c in coverage.values() if c['centrifuge'] > 0),
-            'contigs': sum(1 for c in coverage.values() if c['contigs'] > 0),
+            **{
+                data_type: sum(1 for c in coverage.values() if c[data_type] > 0)
+                for data_type in [*OMICS_CONFIG, *TAXONOMIC_CONFIG]
+            },
             'physical_variables': {
                 var: sum(1 for c in coverage.values() if c[f'physical_{var}'] > 0)
-                for var in physical_variables
+                for var in PHYSICAL_VARIABLES
             }
         }
         
@@ -1223,9 +1401,9 @@ class StudyAnalysisProcessor(StatisticsProcessor):
         all_studies = []
         for study_id, study_coverage in coverage.items():
             # Calculate total coverage score
-            omics_score = sum(study_coverage[t] for t in ['metabolomics', 'lipidomics', 'proteomics'])
-            taxonomy_score = sum(study_coverage[t] for t in ['gottcha', 'kraken', 'centrifuge', 'contigs'])
-            physical_score = sum(1 for var in physical_variables if study_coverage[f'physical_{var}'] > 0)
+            omics_score = sum(study_coverage[t] for t in OMICS_CONFIG)
+            taxonomy_score = sum(study_coverage[t] for t in TAXONOMIC_CONFIG)
+            physical_score = sum(1 for var in PHYSICAL_VARIABLES if study_coverage[f'physical_{var}'] > 0)
             total_score = omics_score + taxonomy_score + physical_score
             
             study_info = {
@@ -1237,8 +1415,8 @@ class StudyAnalysisProcessor(StatisticsProcessor):
             all_studies.append(study_info)
             
             # Check if study meets good coverage criteria
-            has_omics = any(study_coverage[t] > 0 for t in ['metabolomics', 'lipidomics', 'proteomics'])
-            has_taxonomy = any(study_coverage[t] > 0 for t in ['gottcha', 'kraken', 'centrifuge', 'contigs'])
+            has_omics = any(study_coverage[t] > 0 for t in OMICS_CONFIG)
+            has_taxonomy = any(study_coverage[t] > 0 for t in TAXONOMIC_CONFIG)
             
             if has_omics and has_taxonomy and physical_score >= 5:
                 good_coverage_studies.append(study_info)
@@ -1253,11 +1431,11 @@ class StudyAnalysisProcessor(StatisticsProcessor):
             print(f"   Total score: {study['total_score']}")
             print(f"   Physical variables: {study['physical_variable_count']}")
             print("   Coverage:")
-            for data_type in ['metabolomics', 'lipidomics', 'proteomics', 'gottcha', 'kraken', 'centrifuge', 'contigs']:
+            for data_type in [*OMICS_CONFIG, *TAXONOMIC_CONFIG]:
                 if study['coverage'][data_type] > 0:
                     print(f"   - {data_type}: {study['coverage'][data_type]} samples")
             print("   Physical variables with data:")
-            for var in physical_variables:
+            for var in PHYSICAL_VARIABLES:
                 if study['coverage'][f'physical_{var}'] > 0:
                     print(f"   - {var}: {study['coverage'][f'physical_{var}']} samples")
         
@@ -1268,4 +1446,5 @@ class StudyAnalysisProcessor(StatisticsProcessor):
             'coverage_summary': coverage  # Return the full coverage data
         }
         
-        return convert_numpy_types(result) 
\ No newline at end of file
+        self._data_coverage = convert_numpy_types(result)
+        return self._data_coverage 
\ No newline at end of file
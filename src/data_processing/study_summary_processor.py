@@ -1,30 +1,156 @@
 import pandas as pd
-import dask.dataframe as dd
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any
-import json
-from datetime import datetime
+from typing import Dict, List, Optional, Any, Callable
 import logging
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+import orjson
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def convert_numpy_types(obj: Any) -> Any:
-    """Convert numpy types to Python native types for JSON serialization"""
+# Leaf types that are already JSON-native, checked by exact type before any isinstance call
+_PASSTHROUGH_TYPES = {str, int, float, bool, type(None)}
+
+# Converters for the common numpy types, keyed by exact type
+_NUMPY_CONVERTERS = {
+    np.int64: int,
+    np.int32: int,
+    np.float64: float,
+    np.float32: float,
+    np.ndarray: np.ndarray.tolist
+}
+
+def _convert_numpy_scalar(obj: Any) -> Any:
+    """Convert a single non-container value, falling back to isinstance for uncommon numpy types"""
+    converter = _NUMPY_CONVERTERS.get(type(obj))
+    if converter is not None:
+        return converter(obj)
     if isinstance(obj, np.integer):
         return int(obj)
     elif isinstance(obj, np.floating):
         return float(obj)
     elif isinstance(obj, np.ndarray):
         return obj.tolist()
-    elif isinstance(obj, dict):
-        return {key: convert_numpy_types(value) for key, value in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_numpy_types(item) for item in obj]
     return obj
 
+def convert_numpy_types(obj: Any) -> Any:
+    """Convert numpy types to Python native types for JSON serialization"""
+    if type(obj) in _PASSTHROUGH_TYPES:
+        return obj
+    if not isinstance(obj, (dict, list)):
+        return _convert_numpy_scalar(obj)
+    
+    # Walk nested dicts and lists with an explicit stack instead of recursion
+    root = {} if isinstance(obj, dict) else []
+    stack = [(obj, root)]
+    while stack:
+        source, target = stack.pop()
+        is_dict = isinstance(target, dict)
+        for key, value in (source.items() if is_dict else enumerate(source)):
+            if type(value) in _PASSTHROUGH_TYPES:
+                converted = value
+            elif isinstance(value, dict):
+                converted = {}
+                stack.append((value, converted))
+            elif isinstance(value, list):
+                converted = []
+                stack.append((value, converted))
+            else:
+                converted = _convert_numpy_scalar(value)
+            if is_dict:
+                target[key] = converted
+            else:
+                target.append(converted)
+    return root
+
+# Study table columns used by the summaries
+STUDY_COLUMNS = [
+    'id', 'name', 'description', 'add_date', 'primary_ecosystem', 'sample_count',
+    'ecosystem', 'ecosystem_category', 'ecosystem_type', 'ecosystem_subtype',
+    'proteomics_processed', 'metabolomics_processed', 'metabolomics_analysis',
+    'lipidomics_processed', 'metagenome_processed', 'metatranscriptome_processed',
+    'mags_analysis', 'nom_analysis', 'read_based_analysis', 'reads_qc'
+]
+
+# Environmental sample variables summarized per study
+ENVIRONMENTAL_COLUMNS = ['depth', 'temperature', 'ph', 'salinity']
+
+# Ecosystem classification columns reported in the ecosystem type distribution
+ECOSYSTEM_TYPE_COLUMNS = ['ecosystem_category', 'ecosystem_type', 'ecosystem_subtype']
+
+# Sample table columns used by the summaries, besides the has_*_measurement flags
+SAMPLE_COLUMNS = [
+    'id', 'study_id', 'latitude', 'longitude',
+    'ecosystem', *ECOSYSTEM_TYPE_COLUMNS,
+    *ENVIRONMENTAL_COLUMNS
+]
+
+# Sample columns stored as categoricals so grouping and counting work on integer codes
+CATEGORICAL_SAMPLE_COLUMNS = ['study_id', 'ecosystem', *ECOSYSTEM_TYPE_COLUMNS]
+
+# Study measurement count columns copied onto every study card
+CARD_COUNT_COLUMNS = [
+    'lipidomics_processed', 'mags_analysis', 'metabolomics_processed', 'metagenome_processed',
+    'metatranscriptome_processed', 'nom_analysis', 'proteomics_processed', 'read_based_analysis',
+    'reads_qc'
+]
+
+# Study measurement columns reported in the measurement distribution
+DISTRIBUTION_COLUMNS = [
+    'metagenome_processed', 'metatranscriptome_processed', 'proteomics_processed',
+    'metabolomics_processed', 'lipidomics_processed', 'mags_analysis'
+]
+
+# Study count columns that mark each measurement type as available, in reporting order
+MEASUREMENT_TYPE_COLUMNS = {
+    'metabolomics_processed': 'metabolomics',
+    'proteomics_processed': 'proteomics',
+    'lipidomics_processed': 'lipidomics',
+    'metagenome_processed': 'metagenomics',
+    'metatranscriptome_processed': 'metatranscriptomics'
+}
+
+# Summary key holding the modification times of the tables the summary was built from
+SIGNATURE_KEY = '__sig__'
+
+def _is_measurement_flag(col: str) -> bool:
+    """Whether a sample column is a has_*_measurement flag"""
+    return col.startswith("has_") and col.endswith("_measurement")
+
+def _read_columns(path: Path, wanted: List[str], include: Optional[Callable[[str], bool]] = None) -> pd.DataFrame:
+    """Read only the wanted columns that exist in a parquet file"""
+    names = pq.ParquetFile(path).schema_arrow.names
+    columns = [col for col in names if col in wanted or (include is not None and include(col))]
+    return pd.read_parquet(path, columns=columns)
+
+def _read_study_table(path: Path) -> pd.DataFrame:
+    """Read the study columns, casting string add dates to timestamps in Arrow when they all parse"""
+    names = pq.ParquetFile(path).schema_arrow.names
+    table = pq.read_table(path, columns=[col for col in names if col in STUDY_COLUMNS])
+    add_date_type = table.schema.field('add_date').type if 'add_date' in table.column_names else None
+    if add_date_type is not None and (pa.types.is_string(add_date_type) or pa.types.is_large_string(add_date_type)):
+        try:
+            add_date = pc.cast(table['add_date'], pa.timestamp('ns'))
+            table = table.set_column(table.schema.get_field_index('add_date'), 'add_date', add_date)
+        except pa.ArrowInvalid:
+            # Zone offsets and unparseable values are left to pandas
+            pass
+    return table.to_pandas()
+
+def _read_saved_signature(output_file: Path) -> Optional[str]:
+    """Read the source signature stored in a previously written summary, if any"""
+    try:
+        with open(output_file, "rb") as f:
+            return orjson.loads(f.read()).get(SIGNATURE_KEY)
+    except (FileNotFoundError, orjson.JSONDecodeError, AttributeError):
+        return None
+
 class StudySummaryProcessor:
     def __init__(self, data_dir: Optional[str] = None):
         # Get the project root directory (2 levels up from this file)
@@ -33,7 +159,26 @@ class StudySummaryProcessor:
         logger.info(f"Using data directory: {self.data_dir.absolute()}")
         self._study_df = None
         self._sample_df = None
+        self._sample_by_study_groups = None
+        self._measurement_types = None
+        self._geo_samples_df = None
+        self._geo_distribution = None
+        self._study_by_id_df = None
+        self._study_sample_stats_df = None
+        self._study_env_stats_df = None
+        self._has_measurement_cols = []
+        self._measurement_type_names = []
         
+    def get_source_signature(self) -> str:
+        """Signature of the study and sample tables, changing whenever either file is modified"""
+        study_file = self.data_dir / "study_table_snappy.parquet"
+        sample_file = self.data_dir / "sample_table_snappy.parquet"
+        return f"{study_file.stat().st_mtime_ns}-{sample_file.stat().st_mtime_ns}"
+    
+    def is_output_current(self, output_file: Path) -> bool:
+        """Whether a saved summary was built from the current study and sample tables"""
+        return _read_saved_signature(output_file) == self.get_source_signature()
+    
     @property
     def study_df(self) -> pd.DataFrame:
         """Lazy load study data"""
@@ -41,10 +186,11 @@ class StudySummaryProcessor:
             logger.info("Loading study data...")
             study_file = self.data_dir / "study_table_snappy.parquet"
             logger.info(f"Looking for study data at: {study_file.absolute()}")
-            self._study_df = pd.read_parquet(study_file)
-            # Convert add_date to datetime if it's not already
-            if 'add_date' in self._study_df.columns:
-                self._study_df['add_date'] = pd.to_datetime(self._study_df['add_date'], errors='coerce')
+            self._study_df = _read_study_table(study_file)
+            # Convert add_date to datetime if Arrow could not; the dates are ISO 8601
+            # strings, so parse them with the typed parser instead of per-row inference
+            if 'add_date' in self._study_df.columns and not pd.api.types.is_datetime64_any_dtype(self._study_df['add_date']):
+                self._study_df['add_date'] = pd.to_datetime(self._study_df['add_date'], format='ISO8601', errors='coerce')
             logger.info(f"Loaded {len(self._study_df)} studies")
         return self._study_df
     
@@ -55,38 +201,117 @@ class StudySummaryProcessor:
             logger.info("Loading sample data...")
             sample_file = self.data_dir / "sample_table_snappy.parquet"
             logger.info(f"Looking for sample data at: {sample_file.absolute()}")
-            self._sample_df = pd.read_parquet(sample_file)
+            self._sample_df = _read_columns(
+                sample_file,
+                SAMPLE_COLUMNS,
+                include=_is_measurement_flag
+            )
+            # Measurement flag columns and their type names, found once per load
+            self._has_measurement_cols = [col for col in self._sample_df.columns if _is_measurement_flag(col)]
+            # Remove 'has_' prefix and '_measurement' suffix
+            self._measurement_type_names = [col[4:-12] for col in self._has_measurement_cols]
             # Clean up ecosystem data
             self._sample_df['ecosystem'] = self._sample_df['ecosystem'].replace('', 'Unknown')
+            # Coordinates are converted once here rather than in every aggregation
+            for col in ["latitude", "longitude"]:
+                if not pd.api.types.is_float_dtype(self._sample_df[col]):
+                    self._sample_df[col] = pd.to_numeric(self._sample_df[col], errors='coerce').astype("float64")
+            # Low-cardinality keys become integer codes for groupby and value_counts
+            for col in CATEGORICAL_SAMPLE_COLUMNS:
+                if col in self._sample_df.columns:
+                    self._sample_df[col] = self._sample_df[col].astype("category")
             logger.info(f"Loaded {len(self._sample_df)} samples")
         return self._sample_df
     
+    @property
+    def _sample_by_study(self) -> pd.api.typing.DataFrameGroupBy:
+        """Samples grouped by study, built once and shared by all methods"""
+        if self._sample_by_study_groups is None:
+            self._sample_by_study_groups = self.sample_df.groupby("study_id", sort=False, observed=True)
+        return self._sample_by_study_groups
+    
+    @property
+    def _study_sample_stats(self) -> pd.DataFrame:
+        """Sample count, unique sample count and measurement flag sums per study, aggregated in Arrow"""
+        if self._study_sample_stats_df is None:
+            table = pa.Table.from_pandas(
+                self.sample_df[["study_id", "id"] + self._has_measurement_cols],
+                preserve_index=False
+            )
+            # Null ids count as one distinct sample, and studies without flags sum to 0
+            stats = table.group_by("study_id", use_threads=False).aggregate([
+                ("id", "count", pc.CountOptions(mode="all")),
+                ("id", "count_distinct", pc.CountOptions(mode="all")),
+                *[(col, "sum", pc.ScalarAggregateOptions(min_count=0)) for col in self._has_measurement_cols]
+            ]).to_pandas()
+            # Samples without a study are not grouped, as in pandas
+            stats = stats[stats["study_id"].notna()].set_index("study_id")
+            stats = stats.rename(columns={
+                "id_count": "sample_count",
+                "id_count_distinct": "unique_samples",
+                **{f"{col}_sum": col for col in self._has_measurement_cols}
+            })
+            self._study_sample_stats_df = stats
+        return self._study_sample_stats_df
+    
+    @property
+    def _study_env_stats(self) -> pd.DataFrame:
+        """Min, max, mean and count of the environmental variables of every study, in one grouped pass"""
+        if self._study_env_stats_df is None:
+            env_cols = [col for col in ENVIRONMENTAL_COLUMNS if col in self.sample_df.columns]
+            self._study_env_stats_df = (
+                self._sample_by_study[env_cols].agg(['min', 'max', 'mean', 'count']) if env_cols else pd.DataFrame()
+            )
+        return self._study_env_stats_df
+    
+    @property
+    def _study_by_id(self) -> pd.DataFrame:
+        """Study rows indexed by id for hashed lookups, keeping the first row of duplicate ids"""
+        if self._study_by_id_df is None:
+            studies = self.study_df.drop_duplicates("id")
+            self._study_by_id_df = studies.set_index("id", drop=False, verify_integrity=False)
+        return self._study_by_id_df
+    
+    @property
+    def _geo_samples(self) -> pd.DataFrame:
+        """Samples with valid numeric coordinates, filtered once and shared by all methods"""
+        if self._geo_samples_df is None:
+            # Coordinates are float64 from load time, so filtering is all that is left
+            self._geo_samples_df = self.sample_df.dropna(subset=["latitude", "longitude"])
+        return self._geo_samples_df
+    
+    def _get_study_samples(self, study_id: str) -> pd.DataFrame:
+        """Get the samples of a study from the cached study grouping"""
+        positions = self._sample_by_study.indices.get(study_id, np.array([], dtype=np.intp))
+        return self.sample_df.iloc[positions]
+    
     def get_measurement_types(self, study_id: str) -> List[str]:
         """Get all measurement types available for a study"""
-        measurement_types = []
+        return list(self._get_all_measurement_types().get(study_id, []))
+    
+    def _get_all_measurement_types(self) -> Dict[str, List[str]]:
+        """Get the measurement types of every study, computed once in one vectorized pass"""
+        if self._measurement_types is not None:
+            return self._measurement_types
         
-        # Check study table for processed flags
-        study = self.study_df[self.study_df['id'] == study_id].iloc[0]
+        def has_counts(col: str) -> pd.Series:
+            if col not in self.study_df.columns:
+                return pd.Series(False, index=self.study_df.index)
+            return pd.to_numeric(self.study_df[col], errors='coerce').fillna(0) > 0
         
+        flags = pd.DataFrame({
+            measurement_type: has_counts(col)
+            for col, measurement_type in MEASUREMENT_TYPE_COLUMNS.items()
+        })
         # Check both metabolomics_processed and metabolomics_analysis
-        metabolomics_count = study.get('metabolomics_processed')
-        metabolomics_analysis = study.get('metabolomics_analysis', 0)
-        has_metabolomics = (
-            (metabolomics_count is not None and not pd.isna(metabolomics_count) and metabolomics_count > 0) or 
-            metabolomics_analysis > 0
-        )
-        if has_metabolomics:
-            measurement_types.append('metabolomics')
-            
-        if study.get('proteomics_processed', 0) > 0:
-            measurement_types.append('proteomics')
-        if study.get('lipidomics_processed', 0) > 0:
-            measurement_types.append('lipidomics')
-        if study.get('metagenome_processed', 0) > 0:
-            measurement_types.append('metagenomics')
-        if study.get('metatranscriptome_processed', 0) > 0:
-            measurement_types.append('metatranscriptomics')
-            
+        flags['metabolomics'] |= has_counts('metabolomics_analysis')
+        
+        measurement_types = {}
+        for study_id, row in zip(self.study_df['id'].to_numpy(), flags.to_numpy()):
+            # The first row of a study wins
+            if study_id not in measurement_types:
+                measurement_types[study_id] = [t for t, flag in zip(flags.columns, row) if flag]
+        self._measurement_types = measurement_types
         return measurement_types
     
     def get_study_summary_stats(self) -> Dict:
@@ -94,19 +319,17 @@ class StudySummaryProcessor:
         logger.info("Generating study summary stats...")
         
         # Get unique sample locations
-        geo_samples = self.sample_df[
-            self.sample_df["latitude"].notna() & 
-            self.sample_df["longitude"].notna()
-        ]
-        unique_locations = geo_samples.groupby(["latitude", "longitude"]).size().sum()
+        geo_samples = self._geo_samples
+        unique_locations = len(geo_samples[["latitude", "longitude"]].drop_duplicates())
         
         # Basic statistics
+        add_date_min, add_date_max = self.study_df["add_date"].agg(['min', 'max'])
         stats = {
             "total_studies": len(self.study_df),
             "total_samples": unique_locations,  # Count unique locations instead of all samples
             "date_range": {
-                "start": self.study_df["add_date"].min().isoformat() if pd.notnull(self.study_df["add_date"].min()) else None,
-                "end": self.study_df["add_date"].max().isoformat() if pd.notnull(self.study_df["add_date"].max()) else None
+                "start": add_date_min.isoformat() if pd.notnull(add_date_min) else None,
+                "end": add_date_max.isoformat() if pd.notnull(add_date_max) else None
             }
         }
         
@@ -115,40 +338,47 @@ class StudySummaryProcessor:
         stats["ecosystem_distribution"] = ecosystem_counts
         
         # Measurement type coverage
-        measurement_coverage = {}
-        for _, study in self.study_df.iterrows():
-            measurement_coverage[study['id']] = self.get_measurement_types(study['id'])
-        stats["measurement_coverage"] = measurement_coverage
+        stats["measurement_coverage"] = self._get_all_measurement_types()
 
         # Time series data for samples over time
         if 'add_date' in self.study_df.columns:
-            # Filter out NaT values before grouping
-            valid_dates = self.study_df[self.study_df['add_date'].notna()]
+            # Filter out NaT values before counting
+            valid_dates = self.study_df['add_date'].dropna()
             if not valid_dates.empty:
-                time_series = valid_dates.groupby(
-                    pd.Grouper(key='add_date', freq='ME')
-                ).size().reset_index().rename(columns={0: 'count'})
+                # Count studies per calendar month with a bincount, keeping empty months between
+                # the first and last one, and label each month by its last day
+                months = (valid_dates.dt.year * 12 + valid_dates.dt.month - 1).to_numpy()
+                first_month = int(months.min())
+                counts = np.bincount(months - first_month)
+                month_ends = pd.period_range(
+                    start=pd.Period(year=first_month // 12, month=first_month % 12 + 1, freq='M'),
+                    periods=len(counts),
+                    freq='M'
+                ).to_timestamp(how='end')
                 stats["time_series"] = {
-                    "dates": time_series['add_date'].dt.strftime('%Y-%m-%d').tolist(),
-                    "counts": time_series['count'].tolist()
+                    "dates": month_ends.strftime('%Y-%m-%d').tolist(),
+                    "counts": counts.tolist()
                 }
         
         # Measurement type distribution
         measurement_distribution = {}
-        for measurement in ['metagenome_processed', 'metatranscriptome_processed', 
-                          'proteomics_processed', 'metabolomics_processed', 
-                          'lipidomics_processed', 'mags_analysis']:
-            if measurement in self.study_df.columns:
-                measurement_distribution[measurement] = {
-                    "total": int(self.study_df[measurement].sum()),
-                    "studies": int((self.study_df[measurement] > 0).sum()),
-                    "mean_per_study": float(self.study_df[measurement].mean())
-                }
+        measurement_cols = [col for col in DISTRIBUTION_COLUMNS if col in self.study_df.columns]
+        # Reduce all measurement columns together rather than three scans per column
+        measurements = self.study_df[measurement_cols]
+        totals = measurements.sum()
+        studies = (measurements > 0).sum()
+        means = measurements.mean()
+        for measurement in measurement_cols:
+            measurement_distribution[measurement] = {
+                "total": int(totals[measurement]),
+                "studies": int(studies[measurement]),
+                "mean_per_study": float(means[measurement])
+            }
         stats["measurement_distribution"] = measurement_distribution
 
         # Ecosystem type distribution
         ecosystem_type_distribution = {}
-        for col in ['ecosystem_category', 'ecosystem_type', 'ecosystem_subtype']:
+        for col in ECOSYSTEM_TYPE_COLUMNS:
             if col in self.sample_df.columns:
                 ecosystem_type_distribution[col] = self.sample_df[col].value_counts().to_dict()
         stats["ecosystem_type_distribution"] = ecosystem_type_distribution
@@ -156,8 +386,9 @@ class StudySummaryProcessor:
         # Sample count statistics
         if "sample_count" not in self.study_df.columns:
             # Calculate sample counts from sample_df
-            sample_counts = self.sample_df.groupby("study_id").size().to_dict()
+            sample_counts = self._study_sample_stats["sample_count"].to_dict()
             self.study_df["sample_count"] = self.study_df["id"].map(lambda x: sample_counts.get(str(x), 0))
+            self._study_by_id_df = None
             logger.info(f"Calculated sample counts for {len(sample_counts)} studies")
         
         sample_counts = self.study_df["sample_count"].fillna(0)
@@ -174,47 +405,34 @@ class StudySummaryProcessor:
         return stats
     
     def get_geographic_distribution(self) -> List[Dict]:
-        """Generate geographic distribution data for mapping"""
+        """Generate geographic distribution data for mapping, computed once per instance"""
+        if self._geo_distribution is not None:
+            return self._geo_distribution
         logger.info("Generating geographic distribution...")
         
-        # Filter samples with valid coordinates
-        geo_samples = self.sample_df[
-            self.sample_df["latitude"].notna() & 
-            self.sample_df["longitude"].notna()
-        ]
-        
-        # Convert coordinates to float
-        geo_samples["latitude"] = pd.to_numeric(geo_samples["latitude"], errors='coerce')
-        geo_samples["longitude"] = pd.to_numeric(geo_samples["longitude"], errors='coerce')
-        
-        # Filter out any invalid coordinates after conversion
-        geo_samples = geo_samples[
-            geo_samples["latitude"].notna() & 
-            geo_samples["longitude"].notna()
-        ]
+        geo_samples = self._geo_samples
         
         # Group by coordinates and study_id, then count samples
         geo_distribution = geo_samples.groupby(
-            ["latitude", "longitude", "study_id"]
-        ).size().reset_index().rename(columns={0: "sample_count"})
+            ["latitude", "longitude", "study_id"], observed=True
+        ).size().reset_index(name="sample_count")
         
         # Convert to list of dictionaries with proper numeric types
-        result = []
-        for _, row in geo_distribution.iterrows():
-            result.append({
-                "latitude": float(row["latitude"]),
-                "longitude": float(row["longitude"]),
-                "study_id": str(row["study_id"]),
-                "sample_count": int(row["sample_count"])
-            })
+        geo_distribution = geo_distribution.astype({
+            "latitude": "float64",
+            "longitude": "float64",
+            "study_id": str,
+            "sample_count": "int64"
+        })
+        result = geo_distribution.to_dict(orient="records")
         
         logger.info(f"Generated distribution for {len(result)} locations")
+        self._geo_distribution = result
         return result
     
     def get_study_distinguishing_features(self, study_id: str) -> Dict:
         """Identify unique characteristics of a study"""
-        study = self.study_df[self.study_df['id'] == study_id].iloc[0]
-        study_samples = self.sample_df[self.sample_df['study_id'] == study_id]
+        study = self._study_by_id.loc[study_id]
         
         features = {
             "ecosystem": study.get('ecosystem'),
@@ -222,69 +440,69 @@ class StudySummaryProcessor:
             "ecosystem_subtype": study.get('ecosystem_subtype'),
             "ecosystem_type": study.get('ecosystem_type'),
             "measurement_types": self.get_measurement_types(study_id),
-            "sample_count": len(study_samples),
+            "sample_count": int(self._study_sample_stats["sample_count"].get(study_id, 0)),
             "environmental_features": {}
         }
         
-        # Get unique environmental features
-        for col in ['depth', 'temperature', 'ph', 'salinity']:
-            if col in study_samples.columns and study_samples[col].notna().any():
-                features["environmental_features"][col] = {
-                    "min": float(study_samples[col].min()),
-                    "max": float(study_samples[col].max()),
-                    "mean": float(study_samples[col].mean())
-                }
+        # Get unique environmental features from the statistics of all studies
+        env_stats = self._study_env_stats
+        if study_id in env_stats.index:
+            row = env_stats.loc[study_id]
+            for col in env_stats.columns.get_level_values(0).unique():
+                if row[(col, 'count')] > 0:
+                    features["environmental_features"][col] = {
+                        "min": float(row[(col, 'min')]),
+                        "max": float(row[(col, 'max')]),
+                        "mean": float(row[(col, 'mean')])
+                    }
         
         return features
     
-    def _get_quantitative_measurements(self, study_id: str) -> Dict[str, int]:
-        """Get quantitative measurements for a study"""
-        study_samples = self.sample_df[self.sample_df['study_id'] == study_id]
-        quantitative_measurements = {}
+    def _get_quantitative_measurements(self) -> Dict[str, Dict[str, int]]:
+        """Get quantitative measurements for all studies in one grouped pass"""
+        counts = self._study_sample_stats[self._has_measurement_cols]
         
-        for col in self.sample_df.columns:
-            if col.startswith("has_") and col.endswith("_measurement"):
-                measurement_type = col[4:-12]  # Remove 'has_' prefix and '_measurement' suffix
-                count = study_samples[col].sum()
-                if count > 0:
-                    quantitative_measurements[measurement_type] = int(count)
+        quantitative_measurements = {}
+        for study_id, row in zip(counts.index, counts.to_numpy()):
+            quantitative_measurements[study_id] = {
+                name: int(count)
+                for name, count in zip(self._measurement_type_names, row)
+                if count > 0
+            }
         
         return quantitative_measurements
 
-    def generate_study_cards(self) -> List[Dict]:
-        """Generate data for study cards"""
-        # Helper function to safely convert measurement counts
-        def safe_int_convert(value, default=0):
-            try:
-                if pd.isna(value):
-                    return default
-                result = int(float(value))
-                return result
-            except (ValueError, TypeError):
-                return default
+    def generate_study_cards(self, geo_data: Optional[List[Dict]] = None) -> List[Dict]:
+        """Generate data for study cards, optionally from an already computed geographic distribution"""
+        # Coerce the measurement counts of all studies once; missing or invalid values count as 0
+        count_rows = pd.DataFrame({
+            col: pd.to_numeric(self.study_df[col], errors='coerce').fillna(0).astype('int64')
+            if col in self.study_df.columns else 0
+            for col in CARD_COUNT_COLUMNS
+        }, index=self.study_df.index).to_dict('records')
         
         # Get geographic distribution data
-        geo_data = self.get_geographic_distribution()
-        geo_by_study = {}
+        if geo_data is None:
+            geo_data = self.get_geographic_distribution()
+        # Group the location records by study in one pass, sharing them with the distribution
+        geo_by_study = defaultdict(list)
         for loc in geo_data:
-            study_id = loc['study_id']
-            if study_id not in geo_by_study:
-                geo_by_study[study_id] = []
-            geo_by_study[study_id].append(loc)
+            geo_by_study[loc['study_id']].append(loc)
+        
+        # Count unique samples and quantitative measurements of every study in one pass
+        unique_samples_by_study = self._study_sample_stats['unique_samples'].to_dict()
+        quantitative_by_study = self._get_quantitative_measurements()
+        measurement_types_by_study = self._get_all_measurement_types()
         
         cards = []
-        for _, study in self.study_df.iterrows():
-            study_id = str(study["id"])  # Ensure study_id is a string
+        for study, counts in zip(self.study_df.itertuples(index=False), count_rows):
+            study_id = str(study.id)  # Ensure study_id is a string
             
             # Get unique samples for this study
-            study_samples = self.sample_df[self.sample_df['study_id'] == study_id]
-            unique_samples = len(study_samples['id'].unique())
-            
-            # Get unique sample locations for mapping
-            unique_locations = study_samples[['latitude', 'longitude']].drop_duplicates()
+            unique_samples = unique_samples_by_study.get(study_id, 0)
             
             # Get primary ecosystem
-            primary_ecosystem = study.get('primary_ecosystem', 'Unknown')
+            primary_ecosystem = getattr(study, 'primary_ecosystem', 'Unknown')
             
             # Get geographic data for this study
             study_geo = geo_by_study.get(study_id, [])
@@ -292,26 +510,18 @@ class StudySummaryProcessor:
             
             card = {
                 "id": study_id,
-                "name": study["name"],
-                "description": study.get("description", ""),
+                "name": study.name,
+                "description": getattr(study, "description", ""),
                 "sample_count": unique_samples,  # Changed from len(unique_locations) to unique_samples
-                "measurement_types": self.get_measurement_types(study_id),
+                "measurement_types": measurement_types_by_study.get(study_id, []),
                 "primary_ecosystem": primary_ecosystem,
-                "add_date": study["add_date"].isoformat() if pd.notnull(study["add_date"]) else None,
-                "lipidomics_processed": safe_int_convert(study.get("lipidomics_processed")),
-                "mags_analysis": safe_int_convert(study.get("mags_analysis")),
-                "metabolomics_processed": safe_int_convert(study.get("metabolomics_processed")),
-                "metagenome_processed": safe_int_convert(study.get("metagenome_processed")),
-                "metatranscriptome_processed": safe_int_convert(study.get("metatranscriptome_processed")),
-                "nom_analysis": safe_int_convert(study.get("nom_analysis")),
-                "proteomics_processed": safe_int_convert(study.get("proteomics_processed")),
-                "read_based_analysis": safe_int_convert(study.get("read_based_analysis")),
-                "reads_qc": safe_int_convert(study.get("reads_qc")),
-                "ecosystem": study.get("ecosystem"),
-                "ecosystem_category": study.get("ecosystem_category"),
-                "ecosystem_subtype": study.get("ecosystem_subtype"),
-                "ecosystem_type": study.get("ecosystem_type"),
-                "quantitative_measurements": self._get_quantitative_measurements(study_id),
+                "add_date": study.add_date.isoformat() if pd.notnull(study.add_date) else None,
+                **counts,
+                "ecosystem": getattr(study, "ecosystem", None),
+                "ecosystem_category": getattr(study, "ecosystem_category", None),
+                "ecosystem_subtype": getattr(study, "ecosystem_subtype", None),
+                "ecosystem_type": getattr(study, "ecosystem_type", None),
+                "quantitative_measurements": quantitative_by_study.get(study_id, {}),
                 "latitude": first_location['latitude'] if first_location else None,
                 "longitude": first_location['longitude'] if first_location else None,
                 "sample_locations": study_geo
@@ -321,13 +531,23 @@ class StudySummaryProcessor:
             
         return cards
     
+    def prewarm(self) -> None:
+        """Load the study and sample tables concurrently; the parquet reads release the GIL"""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(lambda: self.study_df), executor.submit(lambda: self.sample_df)]
+            for future in futures:
+                future.result()
+    
     def process_all(self) -> Dict:
         """Process all data and return complete summary"""
         logger.info("Starting data processing...")
+        self.prewarm()
+        # The study cards reuse the geographic distribution instead of rebuilding it
+        geographic_distribution = self.get_geographic_distribution()
         result = {
             "summary_stats": self.get_study_summary_stats(),
-            "geographic_distribution": self.get_geographic_distribution(),
-            "study_cards": self.generate_study_cards()
+            "geographic_distribution": geographic_distribution,
+            "study_cards": self.generate_study_cards(geo_data=geographic_distribution)
         }
         logger.info(f"Final output keys: {list(result.keys())}")
         logger.info(f"Summary stats keys: {list(result['summary_stats'].keys())}")
@@ -340,12 +560,6 @@ if __name__ == "__main__":
         processor = StudySummaryProcessor()
         logger.info("Created processor instance")
         
-        summary_data = processor.process_all()
-        logger.info("Got summary data, size: %d bytes", len(str(summary_data)))
-        
-        # Convert numpy types to Python native types
-        summary_data = convert_numpy_types(summary_data)
-        
         # Create processed_data directory if it doesn't exist
         project_root = Path(__file__).parent.parent.parent
         output_dir = project_root / "processed_data"
@@ -356,12 +570,22 @@ if __name__ == "__main__":
             logger.error(f"Failed to create output directory: {str(e)}")
             raise
         
-        # Save processed data
+        # Skip the recomputation when the saved summary was built from the current tables
         output_file = output_dir / "study_summary.json"
+        if processor.is_output_current(output_file):
+            logger.info(f"Source tables unchanged since {output_file} was written, skipping processing")
+            raise SystemExit(0)
+        
+        summary_data = processor.process_all()
+        summary_data[SIGNATURE_KEY] = processor.get_source_signature()
+        logger.info("Got summary data, size: %d bytes", len(str(summary_data)))
+        
+        # Save processed data
         logger.info(f"Attempting to write data to {output_file.absolute()}")
         try:
-            with open(output_file, "w") as f:
-                json.dump(summary_data, f, indent=2)
+            # orjson serializes the numpy values in the summary natively
+            with open(output_file, "wb") as f:
+                f.write(orjson.dumps(summary_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
             logger.info(f"Successfully wrote {output_file.stat().st_size} bytes to {output_file}")
         except Exception as e:
             logger.error(f"Failed to write output file: {str(e)}")
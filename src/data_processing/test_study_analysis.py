@@ -6,7 +6,6 @@ from pathlib import Path
 import pandas as pd
 from src.data_processing.study_analysis_processor import StudyAnalysisProcessor
 import unittest
-import time
 import os
 
 # Configure logging
@@ -35,41 +34,26 @@ def analyze_study_data_coverage(processor: StudyAnalysisProcessor) -> pd.DataFra
     omics_vars = ['metabolomics', 'lipidomics', 'proteomics']
     taxonomic_vars = ['gottcha', 'kraken', 'centrifuge', 'contigs']
     
-    # Initialize results DataFrame
-    results = []
+    # Count physical variables with data and samples of every study in one grouped pass
+    present_vars = [var for var in physical_vars if var in sample_df.columns]
+    samples_by_study = sample_df.groupby('study_id', sort=False)
+    study_ids = study_df['id']
+    physical_counts = (samples_by_study[present_vars].count() > 0).sum(axis=1)
+    sample_counts = samples_by_study.size()
     
-    for _, study in study_df.iterrows():
-        study_id = study['id']
-        study_samples = sample_df[sample_df['study_id'] == study_id]
-        
-        # Count physical variables with data
-        physical_count = sum(
-            1 for var in physical_vars 
-            if var in study_samples.columns and study_samples[var].notna().any()
-        )
-        
-        # Count omics types
-        omics_count = sum(
-            1 for var in omics_vars
-            if study.get(f'{var}_processed', 0) > 0
-        )
-        
-        # Count taxonomic types
-        taxonomic_count = sum(
-            1 for var in taxonomic_vars
-            if study.get(f'{var}_processed', 0) > 0
-        )
-        
-        results.append({
-            'study_id': study_id,
-            'name': study['name'],
-            'physical_vars': physical_count,
-            'omics_types': omics_count,
-            'taxonomic_types': taxonomic_count,
-            'sample_count': len(study_samples)
-        })
+    # Count omics and taxonomic types from the study columns
+    def count_processed(variables):
+        columns = [f'{var}_processed' for var in variables if f'{var}_processed' in study_df.columns]
+        return (study_df[columns] > 0).sum(axis=1).astype('int64').to_numpy()
     
-    return pd.DataFrame(results)
+    return pd.DataFrame({
+        'study_id': study_ids.to_numpy(),
+        'name': study_df['name'].to_numpy(),
+        'physical_vars': physical_counts.reindex(study_ids, fill_value=0).to_numpy(),
+        'omics_types': count_processed(omics_vars),
+        'taxonomic_types': count_processed(taxonomic_vars),
+        'sample_count': sample_counts.reindex(study_ids, fill_value=0).to_numpy()
+    })
 
 def test_study_analysis():
     """Test the StudyAnalysisProcessor with multiple studies."""
@@ -140,6 +124,7 @@ def test_study_analysis():
 class TestStudyAnalysisProcessor(unittest.TestCase):
     def setUp(self):
         self.processor = StudyAnalysisProcessor()
+        self.processor._cache_hits = 0
         
     def test_initial_processing(self):
         """Test initial processing of all studies"""
@@ -164,20 +149,19 @@ class TestStudyAnalysisProcessor(unittest.TestCase):
     def test_cache_behavior(self):
         """Test caching behavior and invalidation"""
         # First run
-        start_time = time.time()
         coverage1 = self.processor.analyze_data_coverage()
-        first_run_time = time.time() - start_time
+        self.assertEqual(self.processor._cache_hits, 0)
         
         # Second run (should use cache)
-        start_time = time.time()
-        coverage2 = self.processor.analyze_data_coverage()
-        second_run_time = time.time() - start_time
+        self.processor.analyze_data_coverage()
         
-        # Verify cache is working (second run should be faster)
-        self.assertLess(second_run_time, first_run_time)
+        # Verify cache is working
+        self.assertEqual(self.processor._cache_hits, 1)
         
-        # Verify results are consistent
-        self.assertEqual(coverage1['total_studies'], coverage2['total_studies'])
+        # Verify the cached results match a fresh computation
+        fresh_coverage = StudyAnalysisProcessor().analyze_data_coverage()
+        self.assertEqual(coverage1['total_studies'], fresh_coverage['total_studies'])
+        self.assertEqual(coverage1['coverage_summary'], fresh_coverage['coverage_summary'])
         
     def test_study_specific_analysis(self):
         """Test analysis for specific studies"""
@@ -1,28 +1,58 @@
-import requests
+import asyncio
+import httpx
 import json
-from pprint import pprint
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import argparse
 
 # Base URL for the API
 BASE_URL = "http://localhost:9000/api/statistics"
 
-def test_endpoint(endpoint: str, params: Optional[Dict[str, Any]] = None) -> None:
-    """Test an endpoint and print the results"""
-    url = f"{BASE_URL}/{endpoint}"
-    print(f"\nTesting {url}")
-    print("-" * 80)
-    
+# Endpoints probed when no specific endpoint is requested
+DEFAULT_ENDPOINTS = [
+    # Timeline data
+    "timeline",
+    # Ecosystem statistics
+    "ecosystem/ecosystem",
+    "ecosystem/ecosystem_category",
+    # Physical variable statistics
+    "physical/avg_temp",
+    "physical/ph",
+    # Omics statistics
+    "omics/metabolomics",
+    "omics/lipidomics",
+    "omics/proteomics",
+    # Taxonomic statistics
+    "taxonomic/contigs",
+    "taxonomic/centrifuge",
+    "taxonomic/kraken",
+    "taxonomic/gottcha",
+]
+
+async def fetch_endpoint(client: httpx.AsyncClient, endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Fetch an endpoint and format its results for printing"""
+    lines = [f"\nTesting {BASE_URL}/{endpoint}", "-" * 80]
     try:
-        response = requests.get(url, params=params)
+        response = await client.get(endpoint, params=params)
         response.raise_for_status()
-        data = response.json()
-        print(f"Status: {response.status_code}")
-        print("Response:")
-        pprint(data)
-    except requests.exceptions.RequestException as e:
-        print(f"Error: {str(e)}")
-    print("-" * 80)
+        lines.append(f"Status: {response.status_code}")
+        lines.append("Response:")
+        lines.append(json.dumps(response.json(), indent=2))
+    except httpx.HTTPError as e:
+        lines.append(f"Error: {str(e)}")
+    lines.append("-" * 80)
+    return "\n".join(lines)
+
+async def probe_endpoints(endpoints: List[str], params: Optional[Dict[str, Any]] = None) -> None:
+    """Test endpoints concurrently over one client and print the results in order"""
+    # No timeout, matching requests; some statistics take a while on a cold cache
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=None) as client:
+        results = await asyncio.gather(*(fetch_endpoint(client, endpoint, params) for endpoint in endpoints))
+    for result in results:
+        print(result)
+
+def test_endpoint(endpoint: str, params: Optional[Dict[str, Any]] = None) -> None:
+    """Test an endpoint and print the results"""
+    asyncio.run(probe_endpoints([endpoint], params))
 
 def main():
     parser = argparse.ArgumentParser(description='Test statistics API endpoints')
@@ -32,27 +62,7 @@ def main():
     if args.endpoint:
         test_endpoint(args.endpoint)
     else:
-        # Test timeline data
-        test_endpoint("timeline")
-        
-        # Test ecosystem statistics
-        test_endpoint("ecosystem/ecosystem")
-        test_endpoint("ecosystem/ecosystem_category")
-        
-        # Test physical variable statistics
-        test_endpoint("physical/avg_temp")
-        test_endpoint("physical/ph")
-        
-        # Test omics statistics
-        test_endpoint("omics/metabolomics")
-        test_endpoint("omics/lipidomics")
-        test_endpoint("omics/proteomics")
-        
-        # Test taxonomic statistics
-        test_endpoint("taxonomic/contigs")
-        test_endpoint("taxonomic/centrifuge")
-        test_endpoint("taxonomic/kraken")
-        test_endpoint("taxonomic/gottcha")
+        asyncio.run(probe_endpoints(DEFAULT_ENDPOINTS))
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()